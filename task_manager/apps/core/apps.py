@@ -1,6 +1,11 @@
 from django.apps import AppConfig
 
+from task_manager.apps.core.error_reporting import init_rollbar
+
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_manager.apps.core"
+
+    def ready(self):
+        init_rollbar()
@@ -0,0 +1,28 @@
+"""Helpers shared by the ``bench_*`` management commands."""
+
+from __future__ import annotations
+
+import statistics
+
+from django.conf import settings
+from django.test import override_settings
+
+
+def latency_percentiles(timings) -> dict[str, float]:
+    """Return the p50 and p99 of ``timings``, which are in milliseconds."""
+    timings = sorted(timings)
+    return {
+        "p50_ms": statistics.median(timings),
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+    }
+
+
+def allow_test_client(**overrides) -> override_settings:
+    """Override ``overrides`` and let the test client's host through.
+
+    The benchmarks run the test client against the real settings, whose
+    ALLOWED_HOSTS do not list its "testserver" host.
+    """
+    return override_settings(
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], **overrides
+    )
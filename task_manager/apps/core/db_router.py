@@ -0,0 +1,85 @@
+"""Send the reads of selected views to the read replicas.
+
+Views opt in with ``ReadReplicaMixin``; ``ReplicaRoutingMiddleware`` turns
+replica reads on for the duration of such a request, which picks one replica
+for every read made meanwhile, so a page never mixes the snapshots of two
+replicas lagging by different amounts. Everything else, including all
+writes, uses the primary.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY = "default"
+
+# the replica the current reads go to; None sends them to the primary
+_replica: ContextVar[str | None] = ContextVar("replica", default=None)
+
+
+def replica_aliases() -> list[str]:
+    return settings.DATABASE_REPLICAS
+
+
+def replica_reads_enabled() -> bool:
+    return _replica.get() is not None
+
+
+def current_replica() -> str | None:
+    return _replica.get()
+
+
+def _pick_replica() -> str | None:
+    # keep the replica already picked for this request
+    if _replica.get() is not None:
+        return _replica.get()
+    replicas = replica_aliases()
+    return random.choice(replicas) if replicas else None
+
+
+def enable_replica_reads() -> None:
+    """Turn replica reads on until the enclosing ``read_from_replica`` ends."""
+    _replica.set(_pick_replica())
+
+
+@contextmanager
+def read_from_replica(enabled: bool = True):
+    token = _replica.set(_pick_replica() if enabled else None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+class ReplicaRouter:
+    # sessions are read right after they are written at login, before a
+    # replica has caught up, so they always come from the primary
+    primary_only_apps = {"sessions"}
+
+    def db_for_read(self, model, **hints):
+        replica = current_replica()
+        if (
+            replica is not None
+            and model._meta.app_label not in self.primary_only_apps
+        ):
+            return replica
+        # let Django use the database of the instance hint, e.g. so labels
+        # prefetched for tasks read from a replica come from that replica
+        return None
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {PRIMARY, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas get their schema through replication
+        return db not in replica_aliases()
@@ -0,0 +1,203 @@
+"""Report errors to Rollbar without making the failing request wait.
+
+Rollbar is initialized once per process from ``CoreConfig.ready``. The
+payload of a report is still built in the request thread (it needs the
+request and the traceback), but sending it is handed to ``ReportQueue``: a
+bounded queue drained by a background thread. Rollbar's item API takes one
+item per request, so the thread still posts every report on its own, only
+over one kept-alive HTTP session. When the queue is full new reports are
+dropped and counted rather than slowing requests down, and the count is
+logged at most once a minute.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from urllib.parse import urljoin
+
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_TIMEOUT = 3
+DROPPED_LOG_INTERVAL = 60
+
+
+class RollbarSender:
+    """Post Rollbar item payloads one by one over a kept-alive session."""
+
+    def __init__(self, endpoint: str, access_token: str, timeout: float):
+        self.url = urljoin(endpoint, "item/")
+        self.access_token = access_token
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def __call__(self, payloads: list[dict]) -> None:
+        for payload in payloads:
+            try:
+                self.session.post(
+                    self.url,
+                    data=json.dumps(payload, default=str),
+                    headers={
+                        "Content-Type": "application/json",
+                        "X-Rollbar-Access-Token": self.access_token,
+                    },
+                    timeout=self.timeout,
+                ).raise_for_status()
+            except requests.RequestException:
+                logger.warning("Could not send an error report to Rollbar.")
+
+
+class ReportQueue:
+    def __init__(
+        self,
+        send,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.send = send
+        self.batch_size = batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self.dropped = 0
+        self._dropped_logged_at: float | None = None
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._worker_pid: int | None = None
+
+    def put(self, payload: dict) -> bool:
+        self._ensure_worker()
+        try:
+            self.queue.put_nowait(payload)
+        except queue.Full:
+            self.dropped += 1
+            self._log_dropped()
+            return False
+        return True
+
+    def _log_dropped(self) -> None:
+        # a burst of errors fills the queue; one line a minute is enough
+        now = time.monotonic()
+        if (
+            self._dropped_logged_at is not None
+            and now - self._dropped_logged_at < DROPPED_LOG_INTERVAL
+        ):
+            return
+        self._dropped_logged_at = now
+        logger.warning(
+            "Error report queue is full, %d reports dropped so far.",
+            self.dropped,
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued report has been sent."""
+        done = threading.Event()
+
+        def wait():
+            self.queue.join()
+            done.set()
+
+        threading.Thread(target=wait, daemon=True).start()
+        return done.wait(timeout)
+
+    def _ensure_worker(self) -> None:
+        # a worker started before gunicorn forked does not exist in the
+        # child, so each process starts its own on first use
+        if self._worker_pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker_pid == os.getpid():
+                return
+            self._worker = threading.Thread(
+                target=self._run, name="rollbar-reports", daemon=True
+            )
+            self._worker.start()
+            self._worker_pid = os.getpid()
+
+    def _run(self) -> None:
+        # takes up to batch_size waiting reports per wake-up; send() still
+        # posts them one at a time
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.send(batch)
+            except Exception:
+                logger.exception("Error report batch failed.")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+
+_report_queue: ReportQueue | None = None
+
+
+def get_report_queue() -> ReportQueue | None:
+    return _report_queue
+
+
+def _enqueue_payload(payload, **kwargs):
+    if _report_queue is None:
+        return payload
+    _report_queue.put(payload)
+    # stop rollbar from sending the payload itself
+    return False
+
+
+def init_rollbar() -> bool:
+    """Set up Rollbar and the report queue once per process."""
+    global _report_queue
+    options = settings.ROLLBAR
+    token = options.get("access_token")
+    if not token or _report_queue is not None:
+        return False
+
+    import rollbar
+    from rollbar.lib import events
+
+    rollbar.init(
+        access_token=token,
+        environment=options.get("environment", "production"),
+        root=str(options.get("root", settings.BASE_DIR)),
+        code_version=options.get("code_version", "1.0"),
+        endpoint=options.get("endpoint", rollbar.DEFAULT_ENDPOINT),
+        handler="blocking",
+        allow_logging_basic_config=False,
+    )
+    _report_queue = ReportQueue(
+        RollbarSender(
+            rollbar.SETTINGS["endpoint"],
+            token,
+            options.get("timeout", DEFAULT_TIMEOUT),
+        ),
+        maxsize=options.get("queue_size", DEFAULT_QUEUE_SIZE),
+        batch_size=options.get("batch_size", DEFAULT_BATCH_SIZE),
+    )
+    events.add_payload_handler(_enqueue_payload)
+    atexit.register(_report_queue.flush, options.get("timeout", 3))
+    return True
+
+
+def report_exception(request, exception: BaseException) -> None:
+    if _report_queue is None:
+        return
+    import rollbar
+
+    try:
+        rollbar.report_exc_info(
+            (type(exception), exception, exception.__traceback__), request
+        )
+    except Exception:
+        logger.exception("Could not build the Rollbar error report.")
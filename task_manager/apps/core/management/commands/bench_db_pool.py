@@ -0,0 +1,127 @@
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from task_manager.apps.core.benchmarks import latency_percentiles
+
+CONNECTION_COUNT_SQL = (
+    "SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test a running server (e.g. gunicorn with several workers) and "
+        "report request latency and the number of PostgreSQL connections it "
+        "holds. Run it once with DB_POOL=0 and once with DB_POOL=1 on the "
+        "server to compare them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000/")
+        parser.add_argument("--path", default="/tasks/")
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, default=20)
+        parser.add_argument("--username", required=True)
+        parser.add_argument("--password", required=True)
+        parser.add_argument(
+            "--sample-interval",
+            type=float,
+            default=0.2,
+            help="Seconds between pg_stat_activity samples.",
+        )
+        parser.add_argument("--output", help="Write the results as JSON.")
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.local = threading.local()
+        url = urljoin(options["base_url"], options["path"])
+
+        samples = []
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self.sample_connections,
+            args=(samples, stop, options["sample_interval"]),
+        )
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(options["concurrency"]) as executor:
+                timings = list(
+                    executor.map(self.timed_get, [url] * options["requests"])
+                )
+        finally:
+            stop.set()
+            sampler.join()
+        elapsed = time.perf_counter() - started
+
+        results = {
+            "url": url,
+            "requests": len(timings),
+            "concurrency": options["concurrency"],
+            "requests_per_second": len(timings) / elapsed,
+            **latency_percentiles(timings),
+            "connections_max": max(samples) if samples else None,
+            "connections_mean": statistics.mean(samples) if samples else None,
+        }
+        for name, value in results.items():
+            self.stdout.write(f"{name}: {value}")
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+
+    def session(self):
+        session = getattr(self.local, "session", None)
+        if session is None:
+            session = self.local.session = self.login()
+        return session
+
+    def login(self):
+        session = requests.Session()
+        login_url = urljoin(self.options["base_url"], "/login/")
+        session.get(login_url).raise_for_status()
+        response = session.post(
+            login_url,
+            data={
+                "username": self.options["username"],
+                "password": self.options["password"],
+                "csrfmiddlewaretoken": session.cookies.get("csrftoken", ""),
+            },
+            headers={"Referer": login_url},
+            allow_redirects=False,
+        )
+        if response.status_code != 302:
+            raise CommandError(f"Login failed with {response.status_code}.")
+        return session
+
+    def timed_get(self, url):
+        session = self.session()
+        started = time.perf_counter()
+        response = session.get(url, allow_redirects=False)
+        elapsed = (time.perf_counter() - started) * 1000
+        if response.status_code != 200:
+            raise CommandError(f"{url} returned {response.status_code}")
+        return elapsed
+
+    def sample_connections(self, samples, stop, interval):
+        if connection.vendor != "postgresql":
+            self.stderr.write(
+                "Connection counts are only sampled on PostgreSQL."
+            )
+            return
+        try:
+            with connection.cursor() as cursor:
+                while not stop.is_set():
+                    cursor.execute(CONNECTION_COUNT_SQL)
+                    # leave out the sampler's own connection
+                    samples.append(cursor.fetchone()[0] - 1)
+                    stop.wait(interval)
+        finally:
+            connection.close()
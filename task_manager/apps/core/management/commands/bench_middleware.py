@@ -0,0 +1,52 @@
+import timeit
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from task_manager.apps.core.middleware import (
+    LoginRequiredWithMessageMiddleware,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time LoginRequiredWithMessageMiddleware on its own for public, "
+        "static, health and login-protected paths."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--number", type=int, default=100_000)
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.order_by("pk").first()
+        if user is None:
+            raise CommandError("No user for the protected paths.")
+
+        response = HttpResponse()
+        middleware = LoginRequiredWithMessageMiddleware(
+            lambda request: response
+        )
+        factory = RequestFactory()
+        paths = {
+            "main": "/",
+            "login": "/login/",
+            "health": "/health/",
+            "static": f"{settings.STATIC_URL}css/app.css",
+            "tasks (protected)": "/tasks/",
+            "task update (protected)": "/tasks/1/update/",
+        }
+        for name, path in paths.items():
+            request = factory.get(path)
+            # what AuthenticationMiddleware would have put there; public
+            # paths must never read it
+            request.user = user
+            seconds = timeit.timeit(
+                lambda request=request: middleware(request),
+                number=options["number"],
+            )
+            self.stdout.write(
+                f"{name}: {seconds / options['number'] * 1e9:.0f}ns/request"
+            )
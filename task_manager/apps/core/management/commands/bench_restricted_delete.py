@@ -0,0 +1,101 @@
+import json
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import RestrictedError
+
+from task_manager.apps.core.mixins import is_delete_restricted
+from task_manager.apps.core.synthetic import Scale, generate
+from task_manager.apps.labels.models import Label
+from task_manager.apps.statuses.models import Status
+from task_manager.apps.tasks.models import Task
+from task_manager.apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare refusing to delete a status, label and user that tasks "
+        "still use: the deletion collector (RestrictedError) against the "
+        "EXISTS pre-check. Reports latency and peak Python memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--populate",
+            type=int,
+            default=0,
+            metavar="N",
+            help="First generate N tasks sharing one status, label and user.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=23)
+        parser.add_argument("--output", help="Write the results as JSON.")
+
+    def handle(self, *args, **options):
+        if options["populate"]:
+            try:
+                generate(
+                    Scale(
+                        users=1,
+                        statuses=1,
+                        labels=1,
+                        tasks=options["populate"],
+                        max_labels=1,
+                    ),
+                    seed=options["seed"],
+                )
+            except ValueError as error:
+                raise CommandError(f"{error} Use another --seed.")
+
+        task = Task.objects.order_by("-pk").first()
+        if task is None:
+            raise CommandError("No tasks found, use --populate.")
+        label = Label.objects.filter(tasks_with_labels__isnull=False).last()
+        objects = {
+            "status": Status.objects.get(pk=task.status_id),
+            "label": label,
+            "user": User.objects.get(pk=task.author_id),
+        }
+
+        results = {}
+        for name, obj in objects.items():
+            if obj is None:
+                continue
+            results[name] = {
+                "collector": self.measure(self.collect, obj, options),
+                "exists": self.measure(is_delete_restricted, obj, options),
+            }
+            for method, result in results[name].items():
+                self.stdout.write(
+                    f"{name} ({method}): p50={result['p50_ms']:.2f}ms "
+                    f"peak={result['peak_kib']:.0f}KiB"
+                )
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+
+    def collect(self, obj):
+        try:
+            with transaction.atomic():
+                obj.delete()
+                # roll the delete back
+                raise CommandError(f"Nothing restricts deleting {obj!r}.")
+        except RestrictedError:
+            return True
+
+    def measure(self, check, obj, options):
+        timings = []
+        for _ in range(options["repeat"]):
+            started = time.perf_counter()
+            if not check(obj):
+                raise CommandError(f"Nothing restricts deleting {obj!r}.")
+            timings.append((time.perf_counter() - started) * 1000)
+        # tracemalloc slows the call down, so take memory from its own run
+        tracemalloc.start()
+        check(obj)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"p50_ms": statistics.median(timings), "peak_kib": peak / 1024}
@@ -0,0 +1,106 @@
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.cache.backends.base import default_key_func
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.apps.core.benchmarks import allow_test_client
+from task_manager.config import Config
+
+BENCH_KEY_PREFIX = "bench_sessions"
+
+
+class KeyRecorder:
+    """Cache key function that remembers every key the benchmark used."""
+
+    def __init__(self):
+        self.keys = set()
+
+    def __call__(self, key, key_prefix, version):
+        self.keys.add(key)
+        return default_key_func(key, key_prefix, version)
+
+
+class Command(BaseCommand):
+    help = (
+        "Request the task list as a logged-in user under each session "
+        "backend and report throughput and queries per request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=200)
+        parser.add_argument(
+            "--username", help="User to log in as (default: first user)."
+        )
+        parser.add_argument("--output", help="Write the results as JSON.")
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.order_by("pk")
+        if options["username"]:
+            users = users.filter(username=options["username"])
+        user = users.first()
+        if user is None:
+            raise CommandError("No user to log in with.")
+
+        url = reverse("tasks_index")
+        results = {}
+        for backend, engine in Config.SESSION_ENGINES.items():
+            # every backend starts cold, and the keys of the real site are
+            # neither read nor evicted
+            recorder = KeyRecorder()
+            bench_cache = {
+                **settings.CACHES["default"],
+                "KEY_PREFIX": BENCH_KEY_PREFIX,
+                "KEY_FUNCTION": recorder,
+            }
+            with allow_test_client(
+                CACHES={**settings.CACHES, "default": bench_cache},
+                SESSION_ENGINE=engine,
+            ):
+                client = Client()
+                client.force_login(user)
+                client.get(url)
+                timings = []
+                with CaptureQueriesContext(connection) as queries:
+                    for _ in range(options["repeat"]):
+                        started = time.perf_counter()
+                        response = client.get(url)
+                        timings.append((time.perf_counter() - started) * 1000)
+                        if response.status_code != 200:
+                            raise CommandError(
+                                f"{url} returned {response.status_code}"
+                            )
+                session_queries = sum(
+                    "django_session" in query["sql"]
+                    for query in queries.captured_queries
+                )
+                results[backend] = {
+                    "requests_per_second": 1000 / statistics.mean(timings),
+                    "p50_ms": statistics.median(timings),
+                    "queries_per_request": (
+                        len(queries.captured_queries) / options["repeat"]
+                    ),
+                    "session_queries_per_request": (
+                        session_queries / options["repeat"]
+                    ),
+                }
+                cache.delete_many(list(recorder.keys))
+
+        for backend, result in results.items():
+            self.stdout.write(
+                f"{backend}: {result['requests_per_second']:.0f} req/s "
+                f"p50={result['p50_ms']:.2f}ms "
+                f"queries={result['queries_per_request']:.1f} "
+                f"(session {result['session_queries_per_request']:.1f})"
+            )
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
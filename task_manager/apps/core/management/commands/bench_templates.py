@@ -0,0 +1,58 @@
+import re
+import statistics
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+
+from task_manager.apps.core.benchmarks import allow_test_client
+
+TEMPLATE_TIMING = re.compile(r"tpl;dur=([\d.]+)")
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the index pages through the test client and report the "
+        "template render time taken from the Server-Timing header."
+    )
+
+    url_names = [
+        "users_index",
+        "statuses_index",
+        "labels_index",
+        "tasks_index",
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument(
+            "--username", help="User to log in as (default: first user)."
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.order_by("pk")
+        if options["username"]:
+            users = users.filter(username=options["username"])
+        user = users.first()
+        if user is None:
+            raise CommandError("No user to log in with.")
+
+        client = Client()
+        client.force_login(user)
+        with allow_test_client():
+            for url_name in self.url_names:
+                timings = [
+                    self.template_time(client, reverse(url_name))
+                    for _ in range(options["repeat"])
+                ]
+                self.stdout.write(
+                    f"{url_name}: mean={statistics.mean(timings):.2f}ms "
+                    f"p50={statistics.median(timings):.2f}ms"
+                )
+
+    def template_time(self, client, url):
+        response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(f"{url} returned {response.status_code}")
+        return float(TEMPLATE_TIMING.search(response["Server-Timing"])[1])
@@ -0,0 +1,163 @@
+import json
+import platform
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.urls import URLPattern, get_resolver, reverse
+
+from task_manager.apps.core.benchmarks import (
+    allow_test_client,
+    latency_percentiles,
+)
+from task_manager.apps.core.middleware import RequestMetrics
+from task_manager.apps.labels.models import Label
+from task_manager.apps.statuses.models import Status
+from task_manager.apps.tasks.models import Task, TasksLabels
+from task_manager.apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "GET every named URL of the apps through the test client as one "
+        "logged-in user and report p50/p99 latency and the query count. Fill "
+        "the database with generate_data first; compare runs with --baseline."
+    )
+
+    apps = ["core", "users", "statuses", "labels", "tasks"]
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--username",
+            help="User to log in as (default: the author of the first task).",
+        )
+        parser.add_argument("--output", help="Write the results as JSON.")
+        parser.add_argument(
+            "--baseline", help="Earlier --output file to compare against."
+        )
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["username"])
+        client = Client()
+        client.force_login(user)
+
+        results = {}
+        with allow_test_client():
+            for name, url in self.urls(user):
+                results[name] = self.measure(client, url, options["repeat"])
+
+        baseline = {}
+        if options["baseline"]:
+            with open(options["baseline"]) as baseline_file:
+                baseline = json.load(baseline_file)["urls"]
+        for name, result in results.items():
+            line = (
+                f"{name} [{result['status']}]: p50={result['p50_ms']:.2f}ms "
+                f"p99={result['p99_ms']:.2f}ms queries={result['queries']}"
+            )
+            if name in baseline:
+                before = baseline[name]
+                line += (
+                    f" (p50 {result['p50_ms'] - before['p50_ms']:+.2f}ms, "
+                    f"queries {result['queries'] - before['queries']:+d})"
+                )
+            self.stdout.write(line)
+
+        if options["output"]:
+            report = {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "vendor": connections["default"].vendor,
+                "python": platform.python_version(),
+                "repeat": options["repeat"],
+                "rows": {
+                    model._meta.label: model.objects.count()
+                    for model in (User, Status, Label, Task, TasksLabels)
+                },
+                "urls": results,
+            }
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2)
+
+    def get_user(self, username):
+        if username:
+            user = User.objects.filter(username=username).first()
+        else:
+            task = Task.objects.order_by("pk").select_related("author").first()
+            user = task.author if task else User.objects.order_by("pk").first()
+        if user is None:
+            raise CommandError("No user to log in with.")
+        return user
+
+    def urls(self, user):
+        """Yield a name and a path for every named URL of ``self.apps``."""
+        pks = {
+            "users": user.pk,
+            "statuses": Status.objects.values_list("pk", flat=True).first(),
+            "labels": Label.objects.values_list("pk", flat=True).first(),
+            # only the author may open the delete page of a task
+            "tasks": Task.objects.filter(author=user)
+            .values_list("pk", flat=True)
+            .first(),
+        }
+        for app in self.apps:
+            patterns = get_resolver(f"task_manager.apps.{app}.urls")
+            for pattern in patterns.url_patterns:
+                if not isinstance(pattern, URLPattern) or not pattern.name:
+                    continue
+                view_class = getattr(pattern.callback, "view_class", None)
+                if view_class and "get" not in view_class.http_method_names:
+                    continue
+                kwargs = {}
+                if "pk" in pattern.pattern.converters:
+                    if pks.get(app) is None:
+                        continue
+                    kwargs["pk"] = pks[app]
+                url = reverse(pattern.name, kwargs=kwargs)
+                yield pattern.name, url
+                for variant, query in self.variants(pattern.name):
+                    yield f"{pattern.name} ({variant})", f"{url}?{query}"
+
+    def variants(self, name):
+        if name == "tasks_index":
+            task_label = TasksLabels.objects.order_by("pk").first()
+            if task_label:
+                yield (
+                    "filtered",
+                    urlencode(
+                        {
+                            "status": task_label.task.status_id,
+                            "label": task_label.label_id,
+                        }
+                    ),
+                )
+            yield "own tasks", "self_tasks=on"
+        elif name.endswith("_search"):
+            yield "prefix", "q=a"
+
+    def measure(self, client, url, repeat):
+        timings = []
+        queries = []
+        for _ in range(repeat):
+            metrics = RequestMetrics()
+            started = time.perf_counter()
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(metrics.record_query)
+                    )
+                response = client.get(url)
+                # streamed responses run their queries while being read
+                response.getvalue()
+            timings.append((time.perf_counter() - started) * 1000)
+            queries.append(metrics.query_count)
+        return {
+            "path": url,
+            "status": response.status_code,
+            **latency_percentiles(timings),
+            "queries": max(queries),
+        }
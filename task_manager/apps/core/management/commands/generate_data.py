@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.apps.core.synthetic import (
+    DEFAULT_PASSWORD,
+    Scale,
+    generate,
+    generated_username,
+    scale_from_options,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the database with synthetic users, statuses, labels and tasks. "
+        "The same --seed on an empty database gives the same data; every "
+        "generated user can log in with --password."
+    )
+
+    def add_arguments(self, parser):
+        defaults = Scale()
+        parser.add_argument("--users", type=int, default=defaults.users)
+        parser.add_argument("--statuses", type=int, default=defaults.statuses)
+        parser.add_argument("--labels", type=int, default=defaults.labels)
+        parser.add_argument("--tasks", type=int, default=defaults.tasks)
+        parser.add_argument(
+            "--max-labels",
+            type=int,
+            default=defaults.max_labels,
+            help="Most labels one task gets.",
+        )
+        parser.add_argument("--seed", type=int, default=52)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--password", default=DEFAULT_PASSWORD)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            created = generate(
+                scale_from_options(options),
+                seed=options["seed"],
+                batch_size=options["batch_size"],
+                password=options["password"],
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        elapsed = time.perf_counter() - started
+
+        summary = ", ".join(
+            f"{count} {name}" for name, count in created.items()
+        )
+        self.stdout.write(f"Created {summary} in {elapsed:.1f}s.")
+        if created["users"]:
+            self.stdout.write(
+                f"Log in as {generated_username(options['seed'], 0)!r} with "
+                f"password {options['password']!r}."
+            )
@@ -0,0 +1,41 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired sessions in chunks. Unlike clearsessions it never "
+        "deletes every expired row in one statement, so a large backlog "
+        "does not hold a long lock on the session table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        engine = import_module(settings.SESSION_ENGINE)
+        get_model_class = getattr(engine.SessionStore, "get_model_class", None)
+        if get_model_class is None:
+            self.stdout.write(
+                f"{settings.SESSION_ENGINE} keeps no sessions to purge."
+            )
+            return
+
+        sessions = get_model_class().objects
+        now = timezone.now()
+        deleted = 0
+        while True:
+            with transaction.atomic():
+                keys = list(
+                    sessions.filter(expire_date__lt=now).values_list(
+                        "pk", flat=True
+                    )[: options["chunk_size"]]
+                )
+                if not keys:
+                    break
+                deleted += sessions.filter(pk__in=keys).delete()[0]
+        self.stdout.write(f"Deleted {deleted} expired sessions.")
@@ -1,35 +1,200 @@
 from __future__ import annotations
 
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack
 from typing import Callable
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.views import redirect_to_login
+from django.db import connections
 from django.urls import reverse_lazy
 
 from task_manager.apps.core import text_constants
+from task_manager.apps.core.db_router import (
+    enable_replica_reads,
+    read_from_replica,
+    replica_aliases,
+)
+from task_manager.apps.core.error_reporting import report_exception
+from task_manager.apps.core.routes import compile_public_paths
 
 
-class LoginRequiredWithMessageMiddleware:
+class RequestMetrics:
+    def __init__(self):
+        self.queries = Counter()
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+    @property
+    def query_count(self) -> int:
+        return sum(self.queries.values())
+
+    def record_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries[sql] += 1
+
+    def duplicates(self, limit: int) -> list[dict]:
+        return [
+            {"sql": sql, "count": count}
+            for sql, count in self.queries.most_common(limit)
+            if count > 1
+        ]
+
+
+class RequestMetricsMiddleware:
+    """Measure wall, database and template time of every request.
+
+    The numbers are returned in the ``Server-Timing`` header and logged as
+    JSON to ``task_manager.requests``. Requests slower than
+    ``settings.SLOW_REQUEST_MS`` are also logged to
+    ``task_manager.requests.slow`` with their most repeated SQL statements.
+    Template time covers ``TemplateResponse`` rendering. A streaming body
+    runs its queries while it is sent, after the headers: they are logged
+    once the body is done, but the header only covers the view.
+    """
+
+    logger = logging.getLogger("task_manager.requests")
+    slow_logger = logging.getLogger("task_manager.requests.slow")
+    duplicates_limit = 5
+
     def __init__(self, get_response: Callable):
         self.get_response = get_response
-        self.login_path = str(reverse_lazy("login"))
-        self.signup_path = str(reverse_lazy("users_create"))
-        self.users_index_path = str(reverse_lazy("users_index"))
-        self.public_paths = {
-            "/",
-            self.login_path,
-            self.signup_path,
-            self.users_index_path,
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        request._request_metrics = metrics
+        started = time.perf_counter()
+        with self.record_queries(metrics):
+            response = self.get_response(request)
+        total_time = time.perf_counter() - started
+
+        response["Server-Timing"] = (
+            f'db;dur={metrics.db_time * 1000:.2f};desc="'
+            f'{metrics.query_count} queries", '
+            f"tpl;dur={metrics.template_time * 1000:.2f}, "
+            f"total;dur={total_time * 1000:.2f}"
+        )
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.measure_stream(
+                response.streaming_content, request, response, started
+            )
+        else:
+            self.log(request, response, total_time)
+        return response
+
+    @staticmethod
+    def record_queries(metrics: RequestMetrics) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(
+                connection.execute_wrapper(metrics.record_query)
+            )
+        return stack
+
+    def measure_stream(self, chunks, request, response, started):
+        # closing the response closes this generator, so a client that
+        # disconnects halfway still gets logged
+        try:
+            with self.record_queries(request._request_metrics):
+                yield from chunks
+        finally:
+            self.log(request, response, time.perf_counter() - started)
+
+    def log(self, request, response, total_time: float) -> None:
+        metrics = request._request_metrics
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total_time * 1000, 2),
+            "db_ms": round(metrics.db_time * 1000, 2),
+            "db_queries": metrics.query_count,
+            "template_ms": round(metrics.template_time * 1000, 2),
         }
+        self.logger.info(json.dumps(record))
+        if total_time * 1000 >= settings.SLOW_REQUEST_MS:
+            record["duplicates"] = metrics.duplicates(self.duplicates_limit)
+            self.slow_logger.warning(json.dumps(record))
+
+    def process_template_response(self, request, response):
+        metrics = request._request_metrics
+        started = time.perf_counter()
+
+        def record_render_time(rendered_response):
+            metrics.template_time += time.perf_counter() - started
+
+        response.add_post_render_callback(record_render_time)
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """Route the reads of ``ReadReplicaMixin`` views to the replicas.
+
+    A request that may have written (any unsafe method) sets a short-lived
+    cookie; while it is present the browser reads from the primary, so the
+    redirect after creating a task shows the new task even if the replicas
+    lag behind.
+    """
+
+    pin_cookie = "primary_reads"
+    safe_methods = {"GET", "HEAD", "OPTIONS", "TRACE"}
+
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
 
     def __call__(self, request):
-        path = request.path
-        if path.startswith("/admin/") or (
-            settings.STATIC_URL and path.startswith(settings.STATIC_URL)
+        with read_from_replica(False):
+            response = self.get_response(request)
+        if replica_aliases() and request.method not in self.safe_methods:
+            response.set_cookie(
+                self.pin_cookie,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        if (
+            getattr(view_class, "read_from_replica", False)
+            and request.method in self.safe_methods
+            and self.pin_cookie not in request.COOKIES
         ):
-            return self.get_response(request)
-        if path in self.public_paths:
+            enable_replica_reads()
+        return None
+
+
+class LoginRequiredWithMessageMiddleware:
+    """Redirect anonymous users to the login page with a message.
+
+    Whether a path is public is decided by one precompiled regex built from
+    the ``login_not_required`` views of the URLconf plus the admin, static
+    and health prefixes, so public requests never touch ``request.user``
+    (and with it the session).
+    """
+
+    public_prefixes = ["admin/", "health/"]
+
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
+        self.login_path = str(reverse_lazy("login"))
+        prefixes = list(self.public_prefixes)
+        if settings.STATIC_URL:
+            prefixes.append(settings.STATIC_URL)
+        self.public_paths = compile_public_paths(prefixes)
+
+    def __call__(self, request):
+        if self.public_paths.match(request.path, 1):
             return self.get_response(request)
         if not request.user.is_authenticated:
             messages.error(request, text_constants.LOGIN_REQUIRED)
@@ -41,42 +206,17 @@ class LoginRequiredWithMessageMiddleware:
 
 
 class RollbarNotifierMiddleware:
-    _initialized = False
+    """Hand unhandled view exceptions to the Rollbar report queue.
+
+    Rollbar itself is set up once per process in ``CoreConfig.ready``.
+    """
 
     def __init__(self, get_response: Callable):
         self.get_response = get_response
 
     def __call__(self, request):
-        if not self._initialized:
-            token = settings.ROLLBAR.get("access_token")
-            if token:
-                try:
-                    import rollbar
-
-                    rollbar.init(
-                        access_token=token,
-                        environment=settings.ROLLBAR.get(
-                            "environment",
-                            "development" if settings.DEBUG else "production",
-                        ),
-                        root=str(settings.BASE_DIR),
-                        code_version=settings.ROLLBAR.get(
-                            "code_version", "1.0"
-                        ),
-                    )
-                except Exception:
-                    pass
-            self._initialized = True
+        return self.get_response(request)
 
-        try:
-            return self.get_response(request)
-        except Exception:
-            token = settings.ROLLBAR.get("access_token")
-            if token:
-                try:
-                    import rollbar
-
-                    rollbar.report_exc_info()
-                except Exception:
-                    pass
-            raise
+    def process_exception(self, request, exception):
+        report_exception(request, exception)
+        return None
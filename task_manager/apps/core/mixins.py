@@ -1,10 +1,15 @@
+import operator
+from functools import reduce
+
 from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.db.models import RestrictedError
+from django.db.models import RESTRICT, Exists, OuterRef, RestrictedError
+from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 
 from task_manager.apps.core import text_constants
+from task_manager.apps.core.pagination import InvalidCursor, paginate_keyset
 
 
 class UserPassesTestWithMessageMixin(UserPassesTestMixin):
@@ -34,11 +39,47 @@ class UserIsTaskAuthorMixin(UserPassesTestWithMessageMixin):
         return self.request.user.id == self.get_object().author_id
 
 
+def restricting_relations(model) -> list:
+    """Return the relations whose ``RESTRICT`` foreign keys point at model."""
+    return [
+        relation
+        for relation in model._meta.related_objects
+        if relation.on_delete is RESTRICT
+    ]
+
+
+def is_delete_restricted(obj) -> bool:
+    """Tell in one indexed query whether a ``RESTRICT`` key blocks deleting.
+
+    The deletion collector only finds out after loading every related row,
+    which for a status used by 100k tasks means 100k model instances.
+    """
+    conditions = [
+        Exists(
+            relation.related_model._base_manager.filter(
+                **{relation.field.name: OuterRef("pk")}
+            )
+        )
+        for relation in restricting_relations(type(obj))
+    ]
+    if not conditions:
+        return False
+    return (
+        type(obj)
+        ._base_manager.filter(reduce(operator.or_, conditions), pk=obj.pk)
+        .exists()
+    )
+
+
 class RedirectOnRestrictedDeleteMixin:
     restict_message = "You can't delete this"
     redirect_url = "main"
 
     def form_valid(self, form):
+        if is_delete_restricted(self.object):
+            messages.error(self.request, self.restict_message)
+            return redirect(reverse_lazy(self.redirect_url))
+        # a task may have started using the object since the check
         try:
             return super().form_valid(form)
         except RestrictedError:
@@ -59,3 +100,48 @@ class RestrictUserDeleteMixin(RedirectOnRestrictedDeleteMixin):
 class RestrictLabelDeleteMixin(RedirectOnRestrictedDeleteMixin):
     restict_message = text_constants.LABEL_RESTRICT_DELETE
     redirect_url = "labels_index"
+
+
+class KeysetPaginationMixin:
+    paginate_by = 50
+    cursor_kwarg = "cursor"
+
+    def get_paginate_function(self):
+        """Return how to page the queryset; keyset paging assumes pk order."""
+        return paginate_keyset
+
+    def paginate_queryset(self, queryset, page_size):
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        paginate = self.get_paginate_function()
+        try:
+            page = paginate(queryset, page_size, cursor)
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        return None, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        page = context.get("page_obj")
+        if page is not None:
+            context["next_page_query"] = self.get_page_query(page.next_cursor)
+            context["previous_page_query"] = self.get_page_query(
+                page.previous_cursor
+            )
+        return context
+
+    def get_page_query(self, cursor):
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query[self.cursor_kwarg] = cursor
+        return query.urlencode()
+
+
+class ReadReplicaMixin:
+    """Serve the reads of this view from a replica.
+
+    Picked up by ``ReplicaRoutingMiddleware``; a no-op when no replicas are
+    configured.
+    """
+
+    read_from_replica = True
@@ -0,0 +1,76 @@
+"""Version stamps that change whenever a model's rows change.
+
+Cached fragments include the stamps of the models they show in
+their cache keys, so a save or delete makes the old entries unreachable.
+The stamps live in the default cache so every worker sees the same value.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+KEY_PREFIX = "model_version"
+
+# label -> fields no cached output shows, so saving only them keeps the stamp
+_unrendered_fields: dict[str, frozenset[str]] = {}
+
+
+def _key(label: str) -> str:
+    return f"{KEY_PREFIX}:{label}"
+
+
+def _new_version() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def get_versions(*labels: str) -> dict[str, str]:
+    keys = {_key(label): label for label in labels}
+    versions = {keys[key]: value for key, value in cache.get_many(keys).items()}
+    missing = {
+        _key(label): _new_version() for label in labels if label not in versions
+    }
+    if missing:
+        cache.set_many(missing, None)
+        versions.update({keys[key]: value for key, value in missing.items()})
+    return versions
+
+
+def get_version(label: str) -> str:
+    return get_versions(label)[label]
+
+
+def bump_version(label: str) -> None:
+    cache.set(_key(label), _new_version(), None)
+
+
+def tracked_labels() -> list[str]:
+    """Return the labels of the models passed to ``track_model_versions``."""
+    return list(_unrendered_fields)
+
+
+def _bump_sender_version(sender, update_fields=None, **kwargs):
+    label = sender._meta.label_lower
+    if update_fields and update_fields <= _unrendered_fields.get(label, set()):
+        return
+    bump_version(label)
+
+
+def track_model_versions(*models, unrendered_fields=()) -> None:
+    """Bump the stamps of ``models`` on every save and delete.
+
+    Saves limited by ``update_fields`` to ``unrendered_fields`` are skipped,
+    e.g. the ``last_login`` update at every login.
+    """
+    for model in models:
+        _unrendered_fields[model._meta.label_lower] = frozenset(
+            unrendered_fields
+        )
+        for signal in (post_save, post_delete):
+            signal.connect(
+                _bump_sender_version,
+                sender=model,
+                dispatch_uid=f"{KEY_PREFIX}:{model._meta.label_lower}",
+            )
@@ -0,0 +1,199 @@
+from django.db.migrations.operations.base import Operation
+
+from task_manager.apps.core.search import (
+    SEARCH_CONFIG,
+    SEARCH_VECTOR_COLUMN,
+    WEIGHTS,
+    fts_table,
+)
+
+
+class AddPrefixSearchIndex(Operation):
+    """Index a text column for case-insensitive prefix search.
+
+    ``istartswith`` compiles to ``UPPER(column::text) LIKE UPPER('abc%')`` on
+    PostgreSQL, which can only use an expression index with
+    ``text_pattern_ops``, and to ``column LIKE 'abc%'`` on SQLite, which needs
+    a ``NOCASE`` index. Neither can be declared portably in ``Meta.indexes``.
+    Other backends are left alone.
+    """
+
+    reversible = True
+    reduces_to_sql = True
+
+    def __init__(self, model_name, field_name, name):
+        self.model_name = model_name
+        self.field_name = field_name
+        self.name = name
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        quote_name = schema_editor.quote_name
+        table = quote_name(model._meta.db_table)
+        column = quote_name(model._meta.get_field(self.field_name).column)
+        name = quote_name(self.name)
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            schema_editor.execute(
+                f"CREATE INDEX {name} ON {table} "
+                f"((UPPER({column}::text)) text_pattern_ops)"
+            )
+        elif vendor == "sqlite":
+            schema_editor.execute(
+                f"CREATE INDEX {name} ON {table} ({column} COLLATE NOCASE)"
+            )
+
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if schema_editor.connection.vendor in {"postgresql", "sqlite"}:
+            name = schema_editor.quote_name(self.name)
+            schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def describe(self):
+        return (
+            f"Create prefix search index {self.name} on "
+            f"{self.model_name}.{self.field_name}"
+        )
+
+    @property
+    def migration_name_fragment(self):
+        return self.name.lower()
+
+
+class AddFullTextSearch(Operation):
+    """Index text columns of a model for ranked full-text search.
+
+    ``fields`` maps each column to its tsvector weight class (``"A"`` is the
+    most important). On PostgreSQL the table gets a generated ``tsvector``
+    column, so every save keeps it current, and a GIN index named ``name``.
+    On SQLite an external content FTS5 table follows the table through
+    triggers and weighs the columns the way ``ts_rank`` does. SQLite drops
+    the triggers whenever a migration rebuilds the table, so such a
+    migration has to remove and add this operation again. Queried with
+    ``task_manager.apps.core.search.full_text_search``.
+    """
+
+    reversible = True
+    reduces_to_sql = True
+
+    def __init__(self, model_name, fields, name):
+        self.model_name = model_name
+        self.fields = fields
+        self.name = name
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        quote_name = schema_editor.quote_name
+        table = model._meta.db_table
+        columns = [
+            quote_name(model._meta.get_field(field).column)
+            for field in self.fields
+        ]
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            vector = " || ".join(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+                f"coalesce({column}, '')), '{weight}')"
+                for column, weight in zip(columns, self.fields.values())
+            )
+            schema_editor.execute(
+                f"ALTER TABLE {quote_name(table)} ADD COLUMN "
+                f"{quote_name(SEARCH_VECTOR_COLUMN)} tsvector "
+                f"GENERATED ALWAYS AS ({vector}) STORED"
+            )
+            schema_editor.execute(
+                f"CREATE INDEX {quote_name(self.name)} ON {quote_name(table)} "
+                f"USING GIN ({quote_name(SEARCH_VECTOR_COLUMN)})"
+            )
+        elif vendor == "sqlite":
+            fts = quote_name(fts_table(table))
+            pk = quote_name(model._meta.pk.column)
+            column_list = ", ".join(columns)
+            new_values = ", ".join(f"new.{column}" for column in columns)
+            old_values = ", ".join(f"old.{column}" for column in columns)
+            weights = ", ".join(
+                str(WEIGHTS[weight]) for weight in self.fields.values()
+            )
+            insert = (
+                f"INSERT INTO {fts}(rowid, {column_list}) "
+                f"VALUES (new.{pk}, {new_values});"
+            )
+            delete = (
+                f"INSERT INTO {fts}({fts}, rowid, {column_list}) "
+                f"VALUES ('delete', old.{pk}, {old_values});"
+            )
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, "
+                f"content='{table}', content_rowid='{model._meta.pk.column}', "
+                f"tokenize='unicode61 remove_diacritics 2')"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {fts}({fts}, rank) "
+                f"VALUES ('rank', 'bm25({weights})')"
+            )
+            for event, timing, body in [
+                ("insert", "AFTER INSERT", insert),
+                ("delete", "AFTER DELETE", delete),
+                (
+                    "update",
+                    f"AFTER UPDATE OF {column_list}",
+                    f"{delete} {insert}",
+                ),
+            ]:
+                trigger = quote_name(f"{self.name}_{event}")
+                schema_editor.execute(
+                    f"CREATE TRIGGER {trigger} {timing} ON {quote_name(table)} "
+                    f"BEGIN {body} END"
+                )
+            schema_editor.execute(
+                f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"
+            )
+
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        quote_name = schema_editor.quote_name
+        table = model._meta.db_table
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            schema_editor.execute(
+                f"DROP INDEX IF EXISTS {quote_name(self.name)}"
+            )
+            schema_editor.execute(
+                f"ALTER TABLE {quote_name(table)} DROP COLUMN IF EXISTS "
+                f"{quote_name(SEARCH_VECTOR_COLUMN)}"
+            )
+        elif vendor == "sqlite":
+            for event in ["insert", "delete", "update"]:
+                trigger = quote_name(f"{self.name}_{event}")
+                schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            schema_editor.execute(
+                f"DROP TABLE IF EXISTS {quote_name(fts_table(table))}"
+            )
+
+    def describe(self):
+        return (
+            f"Create full-text search index {self.name} on "
+            f"{self.model_name}.{', '.join(self.fields)}"
+        )
+
+    @property
+    def migration_name_fragment(self):
+        return self.name.lower()
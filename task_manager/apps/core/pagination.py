@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+
+FORWARD = "n"
+BACKWARD = "p"
+OFFSET = "o"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(direction: str, pk: int) -> str:
+    raw = f"{direction}:{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, directions=(FORWARD, BACKWARD)
+) -> tuple[str, int]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        direction, pk = raw.split(":")
+        pk = int(pk)
+    except (ValueError, binascii.Error, UnicodeError) as error:
+        raise InvalidCursor(cursor) from error
+    # neither pks nor offsets are negative; an offset below 0 would also
+    # make the slice fail
+    if direction not in directions or pk < 0:
+        raise InvalidCursor(cursor)
+    return direction, pk
+
+
+@dataclass
+class KeysetPage:
+    object_list: list = field(default_factory=list)
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+def paginate_keyset(queryset, page_size: int, cursor: str | None = None):
+    """Return one page of ``queryset`` ordered by pk.
+
+    Pages are selected with ``pk > last_seen`` (or ``pk < first_seen`` when
+    going back), so every page costs one indexed range scan regardless of
+    how deep into the table it is.
+    """
+    direction, boundary = decode_cursor(cursor) if cursor else (FORWARD, None)
+
+    if direction == FORWARD:
+        if boundary is not None:
+            queryset = queryset.filter(pk__gt=boundary)
+        rows = list(queryset.order_by("pk")[: page_size + 1])
+        has_next = len(rows) > page_size
+        has_previous = boundary is not None
+        rows = rows[:page_size]
+    else:
+        queryset_before = queryset.filter(pk__lt=boundary).order_by("-pk")
+        rows = list(queryset_before[: page_size + 1])
+        if not rows:
+            return paginate_keyset(queryset, page_size)
+        has_previous = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        # the rows the cursor came from may since be deleted or filtered out
+        has_next = queryset.filter(pk__gt=rows[-1].pk).exists()
+
+    page = KeysetPage(rows)
+    if rows and has_next:
+        page.next_cursor = encode_cursor(FORWARD, rows[-1].pk)
+    if rows and has_previous:
+        page.previous_cursor = encode_cursor(BACKWARD, rows[0].pk)
+    return page
+
+
+def paginate_offset(queryset, page_size: int, cursor: str | None = None):
+    """Return one page of ``queryset`` in its own order, by position.
+
+    For orders with no unique key to seek past, such as search relevance.
+    Each page costs as much as all the pages before it, so keep it for
+    filtered result sets, not whole tables.
+    """
+    offset = decode_cursor(cursor, (OFFSET,))[1] if cursor else 0
+    rows = list(queryset[offset : offset + page_size + 1])
+    page = KeysetPage(rows[:page_size])
+    if len(rows) > page_size:
+        page.next_cursor = encode_cursor(OFFSET, offset + page_size)
+    if offset:
+        page.previous_cursor = encode_cursor(OFFSET, max(offset - page_size, 0))
+    return page
@@ -0,0 +1,115 @@
+"""Check that views run a bounded number of queries, whatever the data size.
+
+``QueryBudgetTestMixin`` is mixed into a ``TestCase`` of each app. It fills
+the database with synthetic data, GETs every URL of ``query_budgets`` as a
+generated user and checks the query count against its budget. It then
+generates ten times the data and fails if any count changed, which is
+what an N+1 query looks like.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.apps.core.model_versions import bump_version, tracked_labels
+from task_manager.apps.core.synthetic import Scale, generate, generated_username
+from task_manager.apps.users.backends import cache_key
+from task_manager.apps.users.models import User
+
+OBJECT_URL_SUFFIXES = ("_detail", "_update", "_delete")
+#: the generated user the budgets are measured as; it authors the most tasks
+BUDGET_USERNAME = generated_username(1, 0)
+
+
+class QueryBudgetTestMixin:
+    #: URL name -> the most queries one GET of it may run
+    query_budgets: dict[str, int] = {}
+    #: queryset whose first row the ``*_detail/update/delete`` URLs show
+    budget_object = None
+    small_scale = Scale(users=3, statuses=2, labels=3, tasks=10, max_labels=2)
+    scale_factor = 10
+
+    @classmethod
+    def setUpClass(cls):
+        object_urls = [
+            name
+            for name in cls.query_budgets
+            if name.endswith(OBJECT_URL_SUFFIXES)
+        ]
+        if object_urls and cls.budget_object is None:
+            raise ImproperlyConfigured(
+                f"{cls.__name__} needs a budget_object queryset for "
+                f"{', '.join(object_urls)}."
+            )
+        super().setUpClass()
+
+    def get_budget_url(self, url_name: str) -> str:
+        if url_name.endswith(OBJECT_URL_SUFFIXES):
+            return reverse(url_name, args=[self.budget_object.first().pk])
+        return reverse(url_name)
+
+    def drop_cached_output(self):
+        """Make the next request miss every cache the pages read.
+
+        New version stamps hide the cached fragments and the request user
+        is loaded again; other keys are left alone.
+        """
+        for label in tracked_labels():
+            bump_version(label)
+        cache.delete(cache_key(self.user.pk))
+
+    def count_queries(self, url_name: str) -> CaptureQueriesContext:
+        url = self.get_budget_url(url_name)
+        # count the queries of an uncached page; cached fragments would
+        # otherwise hide what the view itself does
+        self.drop_cached_output()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+            response.getvalue()
+        self.assertEqual(response.status_code, 200, url)
+        return context
+
+    def measure_budgets(self) -> dict[str, CaptureQueriesContext]:
+        return {name: self.count_queries(name) for name in self.query_budgets}
+
+    def test_query_budgets(self):
+        generate(self.small_scale, seed=1)
+        self.user = User.objects.get(username=BUDGET_USERNAME)
+        self.client.force_login(self.user)
+        small = self.measure_budgets()
+
+        generate(
+            replace(
+                self.small_scale,
+                users=self.small_scale.users * (self.scale_factor - 1),
+                statuses=self.small_scale.statuses * (self.scale_factor - 1),
+                labels=self.small_scale.labels * (self.scale_factor - 1),
+                tasks=self.small_scale.tasks * (self.scale_factor - 1),
+            ),
+            seed=2,
+        )
+        large = self.measure_budgets()
+
+        for url_name, budget in self.query_budgets.items():
+            with self.subTest(url_name=url_name):
+                queries = "\n".join(
+                    query["sql"] for query in small[url_name].captured_queries
+                )
+                self.assertLessEqual(
+                    len(small[url_name]),
+                    budget,
+                    f"{url_name} is over its budget of {budget} queries:\n"
+                    f"{queries}",
+                )
+                self.assertEqual(
+                    len(large[url_name]),
+                    len(small[url_name]),
+                    f"{url_name} runs more queries with "
+                    f"{self.scale_factor}x the data",
+                )
@@ -0,0 +1,45 @@
+"""Classify request paths without resolving them or touching the session."""
+
+from __future__ import annotations
+
+import re
+
+from django.urls import URLPattern, URLResolver, get_resolver
+
+NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+
+def _pattern_regex(pattern) -> str:
+    regex = pattern.pattern.regex.pattern.removeprefix("^")
+    # the same group name may appear in several routes of one alternation
+    return NAMED_GROUP.sub("(?:", regex)
+
+
+def login_not_required_patterns(patterns, prefix: str = "") -> list[str]:
+    """Return the regexes of every route marked with ``login_not_required``."""
+    regexes = []
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            regexes += login_not_required_patterns(
+                pattern.url_patterns, prefix + _pattern_regex(pattern)
+            )
+        elif isinstance(pattern, URLPattern):
+            if getattr(pattern.callback, "login_required", True) is False:
+                regexes.append(prefix + _pattern_regex(pattern))
+    return regexes
+
+
+def compile_public_paths(
+    prefixes: list[str] = (), urlconf: str | None = None
+) -> re.Pattern:
+    """Compile one regex matching the paths that need no login.
+
+    These are the URLconf routes marked ``login_not_required`` and anything
+    under ``prefixes`` (e.g. ``"static/"``), matched against the request path
+    without its leading slash.
+    """
+    alternatives = login_not_required_patterns(
+        get_resolver(urlconf).url_patterns
+    )
+    alternatives += [re.escape(prefix.lstrip("/")) for prefix in prefixes]
+    return re.compile("|".join(f"(?:{regex})" for regex in alternatives))
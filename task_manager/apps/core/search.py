@@ -0,0 +1,93 @@
+"""Ranked full-text search over the columns indexed by ``AddFullTextSearch``.
+
+On PostgreSQL the indexed table has a generated ``tsvector`` column with a
+GIN index; on SQLite an FTS5 table shadows it. ``full_text_search`` filters
+a queryset to the matching rows and orders them by relevance, best first,
+as ``search_rank``. Other backends fall back to ``icontains``.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.db import connections
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_COLUMN = "search_vector"
+# weight of each tsvector class, as ts_rank weighs them by default
+WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+
+WORD = re.compile(r"\w+")
+
+
+def fts_table(db_table: str) -> str:
+    return f"{db_table}_fts"
+
+
+def fts5_query(term: str) -> str:
+    """Quote every word of ``term`` so FTS5 matches rows having them all."""
+    return " ".join(f'"{word}"' for word in WORD.findall(term))
+
+
+def full_text_search(queryset, term: str, fields):
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        return _postgresql_search(queryset, term)
+    if vendor == "sqlite":
+        return _sqlite_search(queryset, term)
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__icontains": term})
+    return queryset.filter(condition).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
+
+
+def _postgresql_search(queryset, term):
+    from django.contrib.postgres.search import (
+        SearchQuery,
+        SearchRank,
+        SearchVectorField,
+    )
+
+    table = queryset.model._meta.db_table
+    query = SearchQuery(term, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.annotate(
+            _search_vector=RawSQL(
+                f'"{table}"."{SEARCH_VECTOR_COLUMN}"',
+                [],
+                output_field=SearchVectorField(),
+            )
+        )
+        .filter(_search_vector=query)
+        .annotate(search_rank=SearchRank(F("_search_vector"), query))
+        .order_by("-search_rank", "pk")
+    )
+
+
+def _sqlite_search(queryset, term):
+    match = fts5_query(term)
+    if not match:
+        return queryset.none()
+    table = queryset.model._meta.db_table
+    fts = fts_table(table)
+    pk_column = queryset.model._meta.pk.column
+    matches = RawSQL(
+        f'SELECT rowid FROM "{fts}" WHERE "{fts}" MATCH %s', [match]
+    )
+    # the FTS5 rank is only available on the rows of a MATCH, so each
+    # matching row looks its rank up by rowid
+    rank = RawSQL(
+        f'SELECT -rank FROM "{fts}" WHERE "{fts}" MATCH %s'
+        f' AND rowid = "{table}"."{pk_column}"',
+        [match],
+        output_field=FloatField(),
+    )
+    return (
+        queryset.filter(pk__in=matches)
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "pk")
+    )
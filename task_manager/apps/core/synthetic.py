@@ -0,0 +1,150 @@
+"""Generate synthetic users, statuses, labels and tasks for benchmarks.
+
+The same seed on an empty database always produces the same data. Rows are
+written with ``bulk_create`` in batches, so a million tasks take minutes,
+not hours. Every generated user shares one password hash, which keeps
+hashing out of the way and lets benchmarks log in as any of them.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from task_manager.apps.core.model_versions import bump_version
+from task_manager.apps.labels.models import Label
+from task_manager.apps.statuses.models import Status
+from task_manager.apps.tasks.counters import count_new_tasks
+from task_manager.apps.tasks.models import Task, TasksLabels
+from task_manager.apps.users.models import User
+
+DEFAULT_PASSWORD = "synthetic"
+
+FIRST_NAMES = (
+    "Alice Bob Charlie Diana Egor Fatima Grace Hiro Irina Jamal Kate Liam "
+    "Maria Nikita Olga Pavel"
+).split()
+LAST_NAMES = (
+    "Smith Johnson Brown Ivanova Petrov Garcia Kim Nguyen Müller Rossi "
+    "Sokolov Tanaka Wilson Zhang"
+).split()
+WORDS = (
+    "report release backup invoice review migration login search export "
+    "onboarding dashboard payment cache deploy translation audit newsletter "
+    "import sync api"
+).split()
+
+
+@dataclass
+class Scale:
+    users: int = 100
+    statuses: int = 5
+    labels: int = 20
+    tasks: int = 1000
+    max_labels: int = 3
+
+
+def generated_username(seed: int, number: int) -> str:
+    return f"synthetic_{seed}_{number}"
+
+
+def generate(
+    scale: Scale,
+    seed: int = 52,
+    batch_size: int = 10_000,
+    password: str = DEFAULT_PASSWORD,
+) -> dict[str, int]:
+    """Create the rows described by ``scale`` and return how many of each.
+
+    Raises ``ValueError`` when users of the same seed already exist, since
+    usernames are unique and derived from the seed.
+    """
+    if User.objects.filter(username=generated_username(seed, 0)).exists():
+        raise ValueError(f"Data for seed {seed} already exists.")
+
+    rng = random.Random(seed)
+    password_hash = make_password(password)
+    created = dict.fromkeys(
+        ["users", "statuses", "labels", "tasks", "task_labels"], 0
+    )
+    with transaction.atomic():
+        user_ids = []
+        for start in range(0, scale.users, batch_size):
+            users = User.objects.bulk_create(
+                User(
+                    username=generated_username(seed, number),
+                    first_name=rng.choice(FIRST_NAMES),
+                    last_name=rng.choice(LAST_NAMES),
+                    password=password_hash,
+                )
+                for number in range(start, min(start + batch_size, scale.users))
+            )
+            user_ids += [user.pk for user in users]
+        status_ids = [
+            status.pk
+            for status in Status.objects.bulk_create(
+                Status(name=f"Status {seed}-{number}")
+                for number in range(scale.statuses)
+            )
+        ]
+        label_ids = [
+            label.pk
+            for label in Label.objects.bulk_create(
+                Label(name=f"{rng.choice(WORDS).title()} {seed}-{number}")
+                for number in range(scale.labels)
+            )
+        ]
+        created.update(
+            users=len(user_ids),
+            statuses=len(status_ids),
+            labels=len(label_ids),
+        )
+        if scale.tasks and not (user_ids and status_ids):
+            raise ValueError("Tasks need at least one user and one status.")
+
+        # a few busy people own most of the work, as in real trackers
+        user_weights = [1 / (rank + 1) for rank in range(len(user_ids))]
+        for start in range(0, scale.tasks, batch_size):
+            size = min(batch_size, scale.tasks - start)
+            authors = rng.choices(user_ids, user_weights, k=size)
+            executors = rng.choices(user_ids, user_weights, k=size)
+            tasks = Task.objects.bulk_create(
+                Task(
+                    name=" ".join(rng.sample(WORDS, 3)).capitalize(),
+                    description=" ".join(rng.choices(WORDS, k=12)),
+                    status_id=rng.choice(status_ids),
+                    author_id=author_id,
+                    executor_id=executor_id if rng.random() > 0.1 else None,
+                )
+                for author_id, executor_id in zip(authors, executors)
+            )
+            task_labels = TasksLabels.objects.bulk_create(
+                TasksLabels(task_id=task.pk, label_id=label_id)
+                for task in tasks
+                for label_id in rng.sample(
+                    label_ids,
+                    rng.randint(0, min(scale.max_labels, len(label_ids))),
+                )
+            )
+            count_new_tasks(tasks)
+            created["tasks"] += len(tasks)
+            created["task_labels"] += len(task_labels)
+
+    # bulk_create sends no post_save, so the cached pages need their
+    # version stamps bumped here
+    for model in (User, Status, Label, Task):
+        bump_version(model._meta.label_lower)
+    return created
+
+
+def scale_from_options(options: dict) -> Scale:
+    return Scale(
+        **{
+            field: options[field]
+            for field in asdict(Scale())
+            if options.get(field) is not None
+        }
+    )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.template import engines
+
+
+def warm_templates() -> int:
+    """Compile every template found in the TEMPLATES ``DIRS``.
+
+    With the cached loader the compiled templates stay in memory, so calling
+    this at worker boot moves the compile cost out of the first requests.
+    """
+    count = 0
+    for engine in engines.all():
+        for template_dir in map(Path, engine.dirs):
+            for path in sorted(template_dir.rglob("*.html")):
+                engine.get_template(path.relative_to(template_dir).as_posix())
+                count += 1
+    return count
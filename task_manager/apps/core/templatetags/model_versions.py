@@ -0,0 +1,15 @@
+from django import template
+
+from task_manager.apps.core.model_versions import get_versions
+
+register = template.Library()
+
+
+@register.simple_tag
+def model_versions(*labels):
+    """Return a cache key part that changes when any of the models does.
+
+    Usage: {% model_versions "statuses.status" "users.user" as version %}
+    """
+    versions = get_versions(*labels)
+    return "-".join(versions[label] for label in labels)
@@ -1,8 +1,47 @@
+import json
+import tempfile
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Count
+from django.db.models.deletion import Collector
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
-from task_manager.apps.core import text_constants
+from task_manager.apps.core import error_reporting, text_constants
+from task_manager.apps.core.benchmarks import latency_percentiles
+from task_manager.apps.core.db_router import (
+    ReplicaRouter,
+    read_from_replica,
+    replica_reads_enabled,
+)
+from task_manager.apps.core.error_reporting import ReportQueue, RollbarSender
+from task_manager.apps.core.management.commands.bench_sessions import (
+    BENCH_KEY_PREFIX,
+)
+from task_manager.apps.core.middleware import ReplicaRoutingMiddleware
+from task_manager.apps.core.mixins import is_delete_restricted
+from task_manager.apps.core.query_budget import QueryBudgetTestMixin
+from task_manager.apps.core.routes import compile_public_paths
+from task_manager.apps.core.synthetic import Scale, generate
+from task_manager.apps.core.template_warmup import warm_templates
+from task_manager.apps.labels.models import Label
+from task_manager.apps.statuses.models import Status
+from task_manager.apps.tasks.models import Task, TasksLabels
+from task_manager.apps.tasks.views import TaskIndexView
 
 
 # Create your tests here.
@@ -36,6 +75,17 @@ class AutehicationTest(TestCase):
         self.assertRedirects(response, self.main_url)
         self.assertContains(response, text_constants.LOGIN_SUCCESS)
 
+    def test_navbar_follows_auth_state(self):
+        tasks_index_url = reverse("tasks_index")
+        response = self.client.get(self.main_url)
+        self.assertNotContains(response, tasks_index_url)
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        response = self.client.get(self.main_url)
+        self.assertContains(response, tasks_index_url)
+        self.assertContains(response, self.logout_url)
+
     def test_logout(self):
         self.client.login(
             username=self.testuser_username, password=self.testuser_password
@@ -43,3 +93,442 @@ class AutehicationTest(TestCase):
         response = self.client.post(self.logout_url, follow=True)
         self.assertRedirects(response, self.main_url)
         self.assertContains(response, text_constants.LOGOUT_SUCCESS)
+
+
+class RestrictedDeleteTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.get(pk=1))
+
+    def test_used_objects_are_refused_without_collecting_tasks(self):
+        cases = [
+            ("statuses_delete", Status, text_constants.STATUS_RESTRICT_DELETE),
+            ("labels_delete", Label, text_constants.LABEL_RESTRICT_DELETE),
+            (
+                "users_delete",
+                get_user_model(),
+                text_constants.USER_RESTRICT_DELETE,
+            ),
+        ]
+        for url_name, model, message in cases:
+            with self.subTest(url_name=url_name):
+                with patch.object(Collector, "collect") as collect:
+                    response = self.client.post(
+                        reverse(url_name, kwargs={"pk": 1}), follow=True
+                    )
+                collect.assert_not_called()
+                self.assertContains(response, message)
+                self.assertTrue(model.objects.filter(pk=1).exists())
+
+    def test_is_delete_restricted(self):
+        self.assertTrue(is_delete_restricted(Label.objects.get(pk=3)))
+        self.assertFalse(
+            is_delete_restricted(Status.objects.create(name="Unused"))
+        )
+        self.assertFalse(
+            is_delete_restricted(
+                get_user_model().objects.create(username="unused")
+            )
+        )
+
+
+class PublicPathsTest(TestCase):
+    def test_public_paths_follow_login_not_required(self):
+        public_paths = compile_public_paths(["static/"])
+        cases = [
+            ("/", True),
+            ("/login/", True),
+            ("/users/", True),
+            ("/users/create/", True),
+            ("/health/", True),
+            ("/static/css/app.css", True),
+            ("/loginx/", False),
+            ("/users/1/update/", False),
+            ("/tasks/", False),
+        ]
+        for path, public in cases:
+            with self.subTest(path=path):
+                self.assertEqual(bool(public_paths.match(path, 1)), public)
+
+    def test_health_skips_session_and_auth(self):
+        response = self.client.get(reverse("health"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+        self.assertFalse(response.wsgi_request.session.accessed)
+
+    def test_protected_path_redirects_anonymous_user(self):
+        response = self.client.get(reverse("tasks_index"))
+        self.assertRedirects(
+            response, f"{reverse('login')}?next={reverse('tasks_index')}"
+        )
+
+
+class RequestMetricsTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    tasks_index_url = reverse("tasks_index")
+
+    def setUp(self):
+        user = get_user_model()
+        user.objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+
+    def test_server_timing_header(self):
+        response = self.client.get(self.tasks_index_url)
+        server_timing = response["Server-Timing"]
+        for metric in ["db;dur=", "queries", "tpl;dur=", "total;dur="]:
+            self.assertIn(metric, server_timing)
+
+    def test_request_log(self):
+        with self.assertLogs("task_manager.requests", "INFO") as logs:
+            self.client.get(self.tasks_index_url)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["path"], self.tasks_index_url)
+        self.assertEqual(record["status"], 200)
+        self.assertGreater(record["db_queries"], 0)
+        self.assertGreater(record["template_ms"], 0)
+
+    def test_streamed_body_queries_are_logged(self):
+        with self.assertLogs("task_manager.requests", "INFO") as logs:
+            response = self.client.get(
+                reverse("tasks_export"), query_params={"format": "csv"}
+            )
+            self.assertEqual(logs.output, [])
+            with CaptureQueriesContext(connection) as body_queries:
+                b"".join(response.streaming_content)
+            response.close()
+        view_queries = int(
+            response["Server-Timing"].split('desc="')[1].split()[0]
+        )
+        record = json.loads(logs.records[0].getMessage())
+        self.assertGreater(len(body_queries), 0)
+        self.assertEqual(record["db_queries"], view_queries + len(body_queries))
+
+    @override_settings(SLOW_REQUEST_MS=0)
+    def test_slow_request_log(self):
+        with self.assertLogs("task_manager.requests.slow", "WARNING") as logs:
+            self.client.get(self.tasks_index_url)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["path"], self.tasks_index_url)
+        self.assertIn("duplicates", record)
+
+
+# no replica database exists, the reads of the requests under test are all
+# answered by the primary and only the routing decision is recorded
+@override_settings(DATABASE_REPLICAS=["replica_1"])
+class ReplicaRoutingTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    tasks_index_url = reverse("tasks_index")
+    tasks_create_url = reverse("tasks_create")
+
+    def setUp(self):
+        user = get_user_model()
+        user.objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.cookies.pop(ReplicaRoutingMiddleware.pin_cookie, None)
+
+    def task_reads(self, method, url, **kwargs):
+        """Return whether each read of a task went to a replica."""
+        reads = []
+
+        def db_for_read(router, model, **hints):
+            if model._meta.model_name == "task":
+                reads.append(replica_reads_enabled())
+            return "default"
+
+        with patch.object(
+            ReplicaRouter, "db_for_read", autospec=True, side_effect=db_for_read
+        ):
+            getattr(self.client, method)(url, **kwargs)
+        return reads
+
+    def test_read_from_replica_nests(self):
+        self.assertFalse(replica_reads_enabled())
+        with read_from_replica():
+            self.assertTrue(replica_reads_enabled())
+            with read_from_replica(False):
+                self.assertFalse(replica_reads_enabled())
+            self.assertTrue(replica_reads_enabled())
+        self.assertFalse(replica_reads_enabled())
+
+    @override_settings(DATABASE_REPLICAS=["replica_1", "replica_2"])
+    def test_one_replica_serves_all_reads_of_a_request(self):
+        router = ReplicaRouter()
+        picked = set()
+        for _ in range(20):
+            with read_from_replica():
+                reads = {router.db_for_read(Task) for _ in range(10)}
+                self.assertEqual(len(reads), 1)
+                with read_from_replica():
+                    self.assertEqual(router.db_for_read(Task), *reads)
+                self.assertIsNone(router.db_for_read(Session))
+            picked |= reads
+        self.assertEqual(picked, {"replica_1", "replica_2"})
+
+    def test_index_and_detail_read_from_replica(self):
+        for url in [self.tasks_index_url, reverse("tasks_detail", args=[1])]:
+            with self.subTest(url=url):
+                reads = self.task_reads("get", url)
+                self.assertTrue(reads)
+                self.assertTrue(all(reads))
+        self.assertFalse(replica_reads_enabled())
+
+    def test_other_views_read_from_primary(self):
+        reads = self.task_reads("get", reverse("tasks_update", args=[1]))
+        self.assertTrue(reads)
+        self.assertFalse(any(reads))
+
+    def test_reads_after_write_stay_on_primary(self):
+        response = self.client.post(
+            self.tasks_create_url,
+            data={
+                "name": "Fresh task",
+                "description": "-",
+                "status": 1,
+                "executor": 1,
+            },
+        )
+        self.assertRedirects(response, self.tasks_index_url)
+        self.assertIn(ReplicaRoutingMiddleware.pin_cookie, response.cookies)
+
+        reads = self.task_reads("get", self.tasks_index_url)
+        self.assertTrue(reads)
+        self.assertFalse(any(reads))
+
+
+class StubRollbarHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append(
+            (
+                self.path,
+                self.headers["X-Rollbar-Access-Token"],
+                json.loads(body),
+            )
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b'{"err": 0, "result": {}}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ErrorReportingTest(TestCase):
+    fixtures = ["users.json"]
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubRollbarHandler)
+        self.server.received = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/api/1/"
+
+    def test_queue_sends_reports_to_endpoint(self):
+        reports = ReportQueue(RollbarSender(self.endpoint, "token", 3))
+        for number in range(3):
+            self.assertTrue(reports.put({"data": {"number": number}}))
+        self.assertTrue(reports.flush(timeout=5))
+
+        self.assertEqual(len(self.server.received), 3)
+        path, token, payload = self.server.received[0]
+        self.assertEqual(path, "/api/1/item/")
+        self.assertEqual(token, "token")
+        self.assertEqual(payload, {"data": {"number": 0}})
+
+    def test_queue_drops_reports_when_full(self):
+        sending = threading.Event()
+        release = threading.Event()
+        batches = []
+
+        def send(batch):
+            sending.set()
+            release.wait(5)
+            batches.append(batch)
+
+        reports = ReportQueue(send, maxsize=2, batch_size=10)
+        reports.put("first")
+        self.assertTrue(sending.wait(5))
+        self.assertTrue(reports.put("second"))
+        self.assertTrue(reports.put("third"))
+        with self.assertLogs(error_reporting.logger, "WARNING") as logs:
+            self.assertFalse(reports.put("fourth"))
+            self.assertFalse(reports.put("fifth"))
+        self.assertEqual(reports.dropped, 2)
+        # the second drop falls within the log interval
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("1 reports dropped", logs.records[0].getMessage())
+
+        release.set()
+        self.assertTrue(reports.flush(timeout=5))
+        self.assertEqual(batches, [["first"], ["second", "third"]])
+
+    def test_view_exception_is_reported_in_background(self):
+        from rollbar.lib import events
+
+        rollbar_settings = {
+            **settings.ROLLBAR,
+            "access_token": "token",
+            "endpoint": self.endpoint,
+        }
+        with override_settings(ROLLBAR=rollbar_settings):
+            self.assertTrue(error_reporting.init_rollbar())
+        self.addCleanup(
+            events.remove_payload_handler, error_reporting._enqueue_payload
+        )
+        self.addCleanup(setattr, error_reporting, "_report_queue", None)
+
+        self.client.force_login(get_user_model().objects.get(pk=1))
+        self.client.raise_request_exception = False
+        with (
+            patch.object(TaskIndexView, "get", side_effect=RuntimeError),
+            self.assertLogs("django.request", "ERROR"),
+        ):
+            response = self.client.get(reverse("tasks_index"))
+        self.assertEqual(response.status_code, 500)
+
+        self.assertTrue(error_reporting.get_report_queue().flush(timeout=5))
+        self.assertEqual(len(self.server.received), 1)
+        _, token, payload = self.server.received[0]
+        self.assertEqual(token, "token")
+        trace = payload["data"]["body"]["trace"]
+        self.assertEqual(trace["exception"]["class"], "RuntimeError")
+
+
+class PurgeSessionsTest(TestCase):
+    def test_purges_expired_sessions_in_chunks(self):
+        now = timezone.now()
+        Session.objects.bulk_create(
+            Session(
+                session_key=f"session{number}",
+                session_data="",
+                expire_date=now + timedelta(days=1 if number < 2 else -1),
+            )
+            for number in range(7)
+        )
+        output = StringIO()
+        call_command("purge_sessions", chunk_size=2, stdout=output)
+        self.assertIn("Deleted 5 expired sessions.", output.getvalue())
+        self.assertEqual(
+            set(Session.objects.values_list("session_key", flat=True)),
+            {"session0", "session1"},
+        )
+
+
+class TemplateWarmupTest(TestCase):
+    def test_warm_templates_compiles_project_templates(self):
+        templates_dir = Path(settings.TEMPLATES[0]["DIRS"][0])
+        expected_count = len(list(templates_dir.rglob("*.html")))
+        self.assertEqual(warm_templates(), expected_count)
+
+
+class QueryBudgetMixinTest(SimpleTestCase):
+    def test_object_urls_need_a_budget_object(self):
+        class NoObjectBudgetTest(QueryBudgetTestMixin, TestCase):
+            query_budgets = {"labels_index": 3, "labels_update": 3}
+
+        with self.assertRaisesMessage(
+            ImproperlyConfigured,
+            "needs a budget_object queryset for labels_update.",
+        ):
+            NoObjectBudgetTest.setUpClass()
+
+
+class SyntheticDataTest(TestCase):
+    scale = Scale(users=5, statuses=2, labels=4, tasks=30, max_labels=2)
+
+    def snapshot(self):
+        return list(
+            Task.objects.order_by("pk").values_list(
+                "name", "status__name", "author__username", "executor_id"
+            )
+        )
+
+    def test_generate_is_reproducible(self):
+        created = generate(self.scale, seed=7, batch_size=8)
+        self.assertEqual(created["users"], 5)
+        self.assertEqual(created["tasks"], 30)
+        self.assertEqual(created["task_labels"], TasksLabels.objects.count())
+        self.assertLessEqual(
+            max(
+                Task.objects.annotate(count=Count("labels")).values_list(
+                    "count", flat=True
+                )
+            ),
+            2,
+        )
+        first_run = self.snapshot()
+
+        Task.objects.all().delete()
+        get_user_model().objects.all().delete()
+        generate(self.scale, seed=7, batch_size=8)
+        self.assertEqual(
+            [row[:3] for row in self.snapshot()],
+            [row[:3] for row in first_run],
+        )
+
+    def test_generate_data_refuses_a_used_seed(self):
+        call_command("generate_data", users=2, tasks=3, stdout=StringIO())
+        self.assertTrue(
+            self.client.login(username="synthetic_52_1", password="synthetic")
+        )
+        with self.assertRaises(CommandError):
+            call_command("generate_data", users=2, tasks=3)
+
+    def test_bench_urls_reports_every_named_url(self):
+        generate(self.scale, seed=7)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "urls.json"
+
+        call_command(
+            "bench_urls", repeat=2, output=str(path), stdout=StringIO()
+        )
+        report = json.loads(path.read_text())
+        self.assertEqual(report["rows"]["tasks.Task"], 30)
+        urls = report["urls"]
+        self.assertNotIn("logout", urls)
+        for name in ["main", "users_update", "tasks_delete", "tasks_export"]:
+            self.assertEqual(urls[name]["status"], 200, name)
+        self.assertGreater(urls["tasks_index"]["queries"], 0)
+
+        output = StringIO()
+        call_command("bench_urls", repeat=1, baseline=str(path), stdout=output)
+        self.assertIn("(p50 ", output.getvalue())
+
+    def test_latency_percentiles_of_unsorted_timings(self):
+        timings = [float(ms) for ms in range(200, 0, -1)]
+        self.assertEqual(
+            latency_percentiles(timings), {"p50_ms": 100.5, "p99_ms": 199.0}
+        )
+        self.assertEqual(
+            latency_percentiles([3.0]), {"p50_ms": 3.0, "p99_ms": 3.0}
+        )
+
+    def test_bench_sessions_leaves_the_site_cache_alone(self):
+        generate(self.scale, seed=7)
+        cache.set("site_key", "kept")
+        call_command("bench_sessions", repeat=2, stdout=StringIO())
+        self.assertEqual(cache.get("site_key"), "kept")
+        # the default cache here is a LocMemCache
+        self.assertFalse(
+            [key for key in cache._cache if BENCH_KEY_PREFIX in key]
+        )
@@ -24,5 +24,12 @@ TASK_CREATED = _("Task has been successfully registered")
 TASK_UPDATED = _("Task has been successfully updated")
 TASK_DELETED = _("Task has been successfully deleted")
 TASK_PERMISSION_DENIED = _("Only author have permission to delete task")
+TASK_UPDATE_CONFLICT = _(
+    "Someone else has changed this task while you were editing it. "
+    "Check the task and save again to overwrite their changes."
+)
+TASK_UPDATE_DELETED = _(
+    "Someone else has deleted this task while you were editing it."
+)
 
 DELETE_CONFIRM = _("Do you really want to delete %(name)s?")
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from task_manager.apps.core.views import (
+    HealthView,
     MainView,
     UserLoginView,
     UserLogoutView,
@@ -10,4 +11,5 @@ urlpatterns = [
     path("", MainView.as_view(), name="main"),
     path("login/", UserLoginView.as_view(), name="login"),
     path("logout/", UserLogoutView.as_view(), name="logout"),
+    path("health/", HealthView.as_view(), name="health"),
 ]
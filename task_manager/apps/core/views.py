@@ -2,12 +2,16 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_not_required
 from django.contrib.auth.views import LoginView, LogoutView
 from django.contrib.messages.views import SuccessMessageMixin
+from django.db import DatabaseError, connection
+from django.db.models import Q
+from django.http import Http404, JsonResponse
 from django.shortcuts import render
 from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
 from django.views import View
 
 from task_manager.apps.core import text_constants
+from task_manager.apps.core.pagination import InvalidCursor, paginate_keyset
 
 
 @method_decorator(login_not_required, name="dispatch")
@@ -16,6 +20,19 @@ class MainView(View):
         return render(request, "core/main.html")
 
 
+@method_decorator(login_not_required, name="dispatch")
+class HealthView(View):
+    """Liveness probe for the load balancer: no session, no templates."""
+
+    def get(self, request, *args, **kwargs):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except DatabaseError:
+            return JsonResponse({"status": "unavailable"}, status=503)
+        return JsonResponse({"status": "ok"})
+
+
 @method_decorator(login_not_required, name="dispatch")
 class UserLoginView(SuccessMessageMixin, LoginView):
     template_name = "core/login.html"
@@ -30,3 +47,37 @@ class UserLogoutView(LogoutView):
     def post(self, request, *args, **kwargs):
         messages.info(request, text_constants.LOGOUT_SUCCESS)
         return super().post(request, *args, **kwargs)
+
+
+class AutocompleteView(View):
+    """Return pages of ``{"id", "text"}`` objects matching a prefix ``q``.
+
+    Every field in ``search_fields`` is matched with ``istartswith``, which
+    the prefix search indexes of the model serve. Pages follow the keyset
+    cursor returned in ``next``.
+    """
+
+    model = None
+    search_fields = []
+    page_size = 20
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.model._default_manager.all()
+        term = request.GET.get("q", "").strip()
+        if term:
+            condition = Q()
+            for field in self.search_fields:
+                condition |= Q(**{f"{field}__istartswith": term})
+            queryset = queryset.filter(condition)
+        try:
+            page = paginate_keyset(
+                queryset, self.page_size, request.GET.get("cursor")
+            )
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        return JsonResponse(
+            {
+                "results": [{"id": obj.pk, "text": str(obj)} for obj in page],
+                "next": page.next_cursor,
+            }
+        )
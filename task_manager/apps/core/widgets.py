@@ -0,0 +1,79 @@
+from django import forms
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+
+
+class AutocompleteMixin:
+    """Render only the selected options and load the rest from a search view.
+
+    The page no longer embeds every row of the choice queryset; the script
+    fills the options from the JSON endpoint named by ``url_name`` as the
+    user types.
+    """
+
+    placeholder = _("Search")
+
+    class Media:
+        js = ["js/autocomplete.js"]
+
+    def __init__(self, url_name, attrs=None):
+        super().__init__(attrs)
+        self.url_name = url_name
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"].update(
+            {
+                "data-autocomplete-url": reverse(self.url_name),
+                "data-autocomplete-placeholder": self.placeholder,
+            }
+        )
+        return context
+
+    def selected_choices(self, values):
+        iterator = self.choices
+        model_pk = iterator.queryset.model._meta.pk
+        pks = []
+        for value in values:
+            try:
+                pks.append(model_pk.to_python(value))
+            except forms.ValidationError:
+                continue
+        if not pks:
+            return []
+        # only the selected rows, never the whole table
+        return [
+            (obj.pk, iterator.field.label_from_instance(obj))
+            for obj in iterator.queryset.filter(pk__in=pks)
+        ]
+
+    def optgroups(self, name, value, attrs=None):
+        choices = self.selected_choices([v for v in value if v])
+        empty_label = getattr(self.choices.field, "empty_label", None)
+        if not self.allow_multiple_selected and empty_label is not None:
+            choices.insert(0, ("", empty_label))
+        return [
+            (
+                None,
+                [
+                    self.create_option(
+                        name,
+                        option_value,
+                        label,
+                        str(option_value) in value,
+                        index,
+                        attrs=attrs,
+                    )
+                ],
+                index,
+            )
+            for index, (option_value, label) in enumerate(choices)
+        ]
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    pass
@@ -1,6 +1,11 @@
 from django.apps import AppConfig
 
+from task_manager.apps.core.model_versions import track_model_versions
+
 
 class LabelsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_manager.apps.labels"
+
+    def ready(self):
+        track_model_versions(self.get_model("Label"))
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from task_manager.apps.core.operations import AddPrefixSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0002_alter_label_options'),
+    ]
+
+    operations = [
+        AddPrefixSearchIndex(
+            model_name='label',
+            field_name='name',
+            name='labels_name_prefix_idx',
+        ),
+    ]
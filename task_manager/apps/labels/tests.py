@@ -3,6 +3,7 @@ from django.test import TestCase
 from django.urls import reverse
 
 from task_manager.apps.core import text_constants
+from task_manager.apps.core.query_budget import QueryBudgetTestMixin
 from task_manager.apps.labels.models import Label
 
 
@@ -91,3 +92,14 @@ class UnAuthenticatedLabelsTest(TestCase):
                 response = self.client.get(url, follow=True)
                 self.assertRedirects(response, f"{login_url}?next={url}")
                 self.assertContains(response, text_constants.LOGIN_REQUIRED)
+
+
+class LabelsQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    query_budgets = {
+        "labels_index": 3,
+        "labels_create": 2,
+        "labels_update": 3,
+        "labels_delete": 3,
+    }
+
+    budget_object = Label.objects.order_by("pk")
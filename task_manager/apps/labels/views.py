@@ -3,12 +3,17 @@ from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager.apps.core import text_constants
-from task_manager.apps.core.mixins import RestrictLabelDeleteMixin
+from task_manager.apps.core.mixins import (
+    KeysetPaginationMixin,
+    ReadReplicaMixin,
+    RestrictLabelDeleteMixin,
+)
+from task_manager.apps.core.views import AutocompleteView
 from task_manager.apps.labels.forms import LabelsForm
 from task_manager.apps.labels.models import Label
 
 
-class LabelIndexView(ListView):
+class LabelIndexView(ReadReplicaMixin, KeysetPaginationMixin, ListView):
     model = Label
     template_name = "labels/index.html"
     context_object_name = "labels"
@@ -42,3 +47,8 @@ class LabelDeleteView(
     success_message = text_constants.LABEL_DELETED
     template_name = "labels/delete.html"
     success_url = reverse_lazy("labels_index")
+
+
+class LabelSearchView(AutocompleteView):
+    model = Label
+    search_fields = ["name"]
@@ -1,6 +1,11 @@
 from django.apps import AppConfig
 
+from task_manager.apps.core.model_versions import track_model_versions
+
 
 class StatusesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_manager.apps.statuses"
+
+    def ready(self):
+        track_model_versions(self.get_model("Status"))
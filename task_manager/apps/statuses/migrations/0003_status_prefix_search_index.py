@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from task_manager.apps.core.operations import AddPrefixSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('statuses', '0002_alter_status_options'),
+    ]
+
+    operations = [
+        AddPrefixSearchIndex(
+            model_name='status',
+            field_name='name',
+            name='statuses_name_prefix_idx',
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.test import TestCase
 from django.urls import reverse
 
 from task_manager.apps.core import text_constants
+from task_manager.apps.core.query_budget import QueryBudgetTestMixin
 from task_manager.apps.statuses.models import Status
 
 
@@ -93,3 +94,14 @@ class UnAuthenticatedStatusesTest(TestCase):
                 response = self.client.get(url, follow=True)
                 self.assertRedirects(response, f"{login_url}?next={url}")
                 self.assertContains(response, text_constants.LOGIN_REQUIRED)
+
+
+class StatusesQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    query_budgets = {
+        "statuses_index": 3,
+        "statuses_create": 2,
+        "statuses_update": 3,
+        "statuses_delete": 3,
+    }
+
+    budget_object = Status.objects.order_by("pk")
@@ -4,11 +4,13 @@ from task_manager.apps.statuses.views import (
     StatusCreateView,
     StatusDeleteView,
     StatusIndexView,
+    StatusSearchView,
     StatusUpdateView,
 )
 
 urlpatterns = [
     path("", StatusIndexView.as_view(), name="statuses_index"),
+    path("search/", StatusSearchView.as_view(), name="statuses_search"),
     path("create/", StatusCreateView.as_view(), name="statuses_create"),
     path(
         "<int:pk>/update/", StatusUpdateView.as_view(), name="statuses_update"
@@ -1,18 +1,31 @@
 from django.contrib.messages.views import SuccessMessageMixin
+from django.db.models.functions import Coalesce
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager.apps.core import text_constants
-from task_manager.apps.core.mixins import RestrictStatusDeleteMixin
+from task_manager.apps.core.mixins import (
+    KeysetPaginationMixin,
+    ReadReplicaMixin,
+    RestrictStatusDeleteMixin,
+)
+from task_manager.apps.core.views import AutocompleteView
 from task_manager.apps.statuses.forms import StatusForm
 from task_manager.apps.statuses.models import Status
 
 
-class StatusIndexView(ListView):
+class StatusIndexView(ReadReplicaMixin, KeysetPaginationMixin, ListView):
     model = Status
     template_name = "statuses/index.html"
     context_object_name = "statuses"
 
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .annotate(task_count=Coalesce("task_counter__count", 0))
+        )
+
 
 class StatusCreateView(SuccessMessageMixin, CreateView):
     model = Status
@@ -42,3 +55,8 @@ class StatusDeleteView(
     success_message = text_constants.STATUS_DELETED
     template_name = "statuses/delete.html"
     success_url = reverse_lazy("statuses_index")
+
+
+class StatusSearchView(AutocompleteView):
+    model = Status
+    search_fields = ["name"]
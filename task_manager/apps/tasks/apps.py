@@ -1,6 +1,28 @@
 from django.apps import AppConfig
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+
+from task_manager.apps.core.model_versions import track_model_versions
 
 
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_manager.apps.tasks"
+
+    def ready(self):
+        from task_manager.apps.tasks.counters import (
+            count_deleted_task,
+            count_saved_task,
+            remember_counted_values,
+        )
+
+        task_model = self.get_model("Task")
+        track_model_versions(task_model)
+        for signal in (pre_save, pre_delete):
+            signal.connect(remember_counted_values, sender=task_model)
+        post_save.connect(count_saved_task, sender=task_model)
+        post_delete.connect(count_deleted_task, sender=task_model)
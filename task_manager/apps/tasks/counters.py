@@ -0,0 +1,130 @@
+"""Keep per-status and per-executor task counts without counting tasks.
+
+Every task save and delete applies the difference it makes to the
+``StatusTaskCounter`` and ``ExecutorTaskCounter`` rows with
+``count = count + delta``, so index pages read a count instead of running
+``COUNT(*) ... GROUP BY`` over the task table. ``bulk_create`` and
+``QuerySet.update`` send no signals: code using them reports the tasks to
+``count_new_tasks`` itself. ``reconcile_task_counters`` repairs any drift.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+COUNTED_FIELDS = ("status_id", "executor_id")
+
+
+def counted_values(task) -> tuple[int | None, int | None]:
+    return tuple(task.__dict__.get(name) for name in COUNTED_FIELDS)
+
+
+def has_counted_values(task) -> bool:
+    """Tell whether none of the counted fields is deferred on ``task``."""
+    return all(name in task.__dict__ for name in COUNTED_FIELDS)
+
+
+def counter_models():
+    return (
+        apps.get_model("tasks", "StatusTaskCounter"),
+        apps.get_model("tasks", "ExecutorTaskCounter"),
+    )
+
+
+def task_deltas(old=(None, None), new=(None, None)) -> dict:
+    """Return ``{counter model: Counter(pk -> delta)}`` for one change."""
+    deltas = {}
+    for model, old_pk, new_pk in zip(counter_models(), old, new):
+        delta = Counter()
+        if old_pk != new_pk:
+            if old_pk is not None:
+                delta[old_pk] -= 1
+            if new_pk is not None:
+                delta[new_pk] += 1
+        deltas[model] = delta
+    return deltas
+
+
+def apply_deltas(deltas: dict) -> None:
+    for model, counts in deltas.items():
+        for pk, delta in counts.items():
+            if not delta:
+                continue
+            counter = model.objects.filter(pk=pk)
+            if counter.update(count=F("count") + delta):
+                continue
+            try:
+                with transaction.atomic():
+                    model.objects.create(pk=pk, count=delta)
+            except IntegrityError:
+                # another request created it in the meantime
+                counter.update(count=F("count") + delta)
+
+
+def count_new_tasks(tasks) -> None:
+    """Count tasks inserted without signals, e.g. by ``bulk_create``."""
+    deltas = {model: Counter() for model in counter_models()}
+    for task in tasks:
+        for model, counts in task_deltas(new=counted_values(task)).items():
+            deltas[model].update(counts)
+    apply_deltas(deltas)
+
+
+def remember_counted_values(sender, instance, **kwargs):
+    if instance.pk is None or hasattr(instance, "_counted_as"):
+        return
+    # built by hand rather than loaded, e.g. by loaddata, or loaded with a
+    # counted field deferred
+    instance._counted_as = (
+        sender._default_manager.filter(pk=instance.pk)
+        .values_list(*COUNTED_FIELDS)
+        .first()
+    ) or (None, None)
+
+
+def count_saved_task(sender, instance, created, **kwargs):
+    old = (None, None) if created else instance._counted_as
+    new = counted_values(instance)
+    apply_deltas(task_deltas(old, new))
+    instance._counted_as = new
+
+
+def count_deleted_task(sender, instance, **kwargs):
+    old = getattr(instance, "_counted_as", counted_values(instance))
+    apply_deltas(task_deltas(old))
+
+
+def reconcile_counters(fix: bool = True) -> dict[str, int]:
+    """Compare the counters with real counts and return how many are off.
+
+    With ``fix`` the wrong counters are overwritten. Tasks written while
+    this runs can leave new drift, so run it when the site is quiet.
+    """
+    task_model = apps.get_model("tasks", "Task")
+    wrong = {}
+    for model, field in zip(counter_models(), ["status", "executor"]):
+        actual = dict(
+            task_model.objects.filter(**{f"{field}__isnull": False})
+            .values_list(field)
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+        stored = dict(model.objects.values_list("pk", "count"))
+        corrected = {
+            pk: actual.get(pk, 0)
+            for pk in actual.keys() | stored.keys()
+            if actual.get(pk, 0) != stored.get(pk, 0)
+        }
+        wrong[model._meta.verbose_name_plural] = len(corrected)
+        if fix and corrected:
+            model.objects.bulk_create(
+                [model(pk=pk, count=count) for pk, count in corrected.items()],
+                update_conflicts=True,
+                update_fields=["count"],
+                unique_fields=[model._meta.pk.name],
+            )
+    return wrong
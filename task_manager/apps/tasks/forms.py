@@ -1,7 +1,15 @@
+from datetime import datetime
+
 import django_filters
 from django import forms
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.apps.core.widgets import (
+    AutocompleteSelect,
+    AutocompleteSelectMultiple,
+)
 from task_manager.apps.labels.models import Label
 from task_manager.apps.statuses.models import Status
 from task_manager.apps.tasks.models import Task
@@ -9,9 +17,17 @@ from task_manager.apps.users.models import User
 
 
 class TaskForm(forms.ModelForm):
+    # updated_at of the task as it was shown, see Task.save_if_unchanged
+    version = forms.CharField(widget=forms.HiddenInput, required=False)
+
     class Meta:
         model = Task
         fields = ["name", "description", "status", "executor", "labels"]
+        widgets = {
+            "status": AutocompleteSelect("statuses_search"),
+            "executor": AutocompleteSelect("users_search"),
+            "labels": AutocompleteSelectMultiple("labels_search"),
+        }
 
         labels = {
             "name": _("Name"),
@@ -21,18 +37,65 @@ class TaskForm(forms.ModelForm):
             "labels": _("Labels"),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk is not None:
+            self.initial["version"] = self.instance.updated_at.isoformat()
+
+    def clean_version(self):
+        version = self.cleaned_data["version"]
+        if not version:
+            return None
+        try:
+            version = datetime.fromisoformat(version)
+        except ValueError:
+            version = None
+        # the form always sends an aware updated_at, so a naive one was
+        # made up; the field is hidden, so its error shows above the form
+        if version is None or timezone.is_naive(version):
+            self.add_error(None, _("Invalid version."))
+            return None
+        return version
+
+    def save(self, commit=True):
+        version = self.cleaned_data.get("version")
+        if not commit or version is None or self.instance._state.adding:
+            return super().save(commit)
+        # editors that sent no version keep last-write-wins
+        with transaction.atomic():
+            self.instance.save_if_unchanged(version)
+            self._save_m2m()
+        return self.instance
+
+    def _save_m2m(self):
+        # labels are the only many-to-many field; RelatedManager.set()
+        # would read them back through a join and recheck before inserting
+        self.instance.set_labels(self.cleaned_data["labels"])
+
 
 class TaskFilterForm(django_filters.FilterSet):
+    search = django_filters.CharFilter(
+        label=_("Search"),
+        method="filter_search",
+    )
+
     status = django_filters.ModelChoiceFilter(
-        queryset=Status.objects.all(), label=_("Status")
+        queryset=Status.objects.all(),
+        label=_("Status"),
+        widget=AutocompleteSelect("statuses_search"),
     )
 
     executor = django_filters.ModelChoiceFilter(
-        queryset=User.objects.all(), label=_("Executor")
+        queryset=User.objects.all(),
+        label=_("Executor"),
+        widget=AutocompleteSelect("users_search"),
     )
 
     label = django_filters.ModelChoiceFilter(
-        queryset=Label.objects.all(), label=_("Label"), field_name="labels"
+        queryset=Label.objects.all(),
+        label=_("Label"),
+        field_name="labels",
+        widget=AutocompleteSelect("labels_search"),
     )
 
     self_tasks = django_filters.BooleanFilter(
@@ -41,6 +104,9 @@ class TaskFilterForm(django_filters.FilterSet):
         label=_("Own tasks only"),
     )
 
+    def filter_search(self, queryset, name, value):
+        return queryset.search(value)
+
     def filter_self_tasks(self, queryset, name, value):
         if value:
             return queryset.filter(author=self.request.user)
@@ -0,0 +1,96 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.apps.core.benchmarks import latency_percentiles
+from task_manager.apps.core.synthetic import Scale, generate
+from task_manager.apps.tasks.models import Task, TasksLabels
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the TaskFilterForm query shapes and print their EXPLAIN "
+        "plans. Run it before and after the task filter indexes migration "
+        "(`migrate tasks 0009` / `migrate tasks`) to compare them."
+    )
+
+    batch_size = 10_000
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--populate",
+            type=int,
+            default=0,
+            metavar="N",
+            help="Generate N tasks before measuring.",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--page-size", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=52)
+        parser.add_argument("--output", help="Write the results as JSON.")
+
+    def handle(self, *args, **options):
+        if options["populate"]:
+            self.populate(options["populate"], options["seed"])
+
+        task = Task.objects.order_by("pk").first()
+        task_label = TasksLabels.objects.order_by("pk").first()
+        if task is None or task_label is None:
+            raise CommandError("No labelled tasks found, use --populate.")
+        middle_pk = (
+            Task.objects.order_by("-pk").values_list("pk", flat=True)[0] // 2
+        )
+
+        shapes = {
+            "status": {"status_id": task.status_id},
+            "executor": {"executor_id": task.executor_id},
+            "author": {"author_id": task.author_id},
+            "label": {"labels": task_label.label_id},
+            "status+executor+author": {
+                "status_id": task.status_id,
+                "executor_id": task.executor_id,
+                "author_id": task.author_id,
+            },
+        }
+        results = {}
+        for name, lookups in shapes.items():
+            for page, extra in [("first", {}), ("deep", {"pk__gt": middle_pk})]:
+                queryset = Task.objects.filter(**lookups, **extra).order_by(
+                    "pk"
+                )[: options["page_size"]]
+                results[f"{name} ({page} page)"] = self.measure(
+                    queryset, options["repeat"]
+                )
+
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name}: p50={result['p50_ms']:.2f}ms "
+                f"p99={result['p99_ms']:.2f}ms"
+            )
+            self.stdout.write(result["plan"])
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+
+    def measure(self, queryset, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - started) * 1000)
+        return {
+            **latency_percentiles(timings),
+            "plan": queryset.explain(),
+        }
+
+    def populate(self, count, seed):
+        try:
+            created = generate(
+                Scale(users=1000, statuses=10, labels=50, tasks=count),
+                seed=seed,
+                batch_size=self.batch_size,
+            )
+        except ValueError as error:
+            raise CommandError(f"{error} Use another --seed.")
+        self.stdout.write(f"Generated {created['tasks']} tasks.")
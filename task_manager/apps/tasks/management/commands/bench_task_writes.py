@@ -0,0 +1,92 @@
+import json
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections, transaction
+
+from task_manager.apps.core.benchmarks import latency_percentiles
+from task_manager.apps.labels.models import Label
+from task_manager.apps.statuses.models import Status
+from task_manager.apps.tasks.models import Task, TasksLabels
+from task_manager.apps.users.models import User
+
+
+def create_tasks(worker, count, status_id, user_id, label_id):
+    """Create ``count`` tasks the way TaskCreateView does, one per request."""
+    connections.close_all()
+    timings = []
+    errors = 0
+    for number in range(count):
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                task = Task.objects.create(
+                    name=f"Bench task {worker}-{number}",
+                    status_id=status_id,
+                    author_id=user_id,
+                    executor_id=user_id,
+                )
+                if label_id is not None:
+                    TasksLabels.objects.create(task=task, label_id=label_id)
+        except OperationalError:
+            errors += 1
+            continue
+        timings.append((time.perf_counter() - started) * 1000)
+    connections.close_all()
+    return timings, errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Create tasks from several processes at once and report the write "
+        "latency and the number of failed writes (e.g. 'database is "
+        "locked'). Compare SQLITE_TUNED=0 and SQLITE_TUNED=1 runs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=4)
+        parser.add_argument(
+            "--tasks", type=int, default=200, help="Tasks per process."
+        )
+        parser.add_argument("--output", help="Write the results as JSON.")
+
+    def handle(self, *args, **options):
+        status = Status.objects.order_by("pk").first()
+        user = User.objects.order_by("pk").first()
+        if status is None or user is None:
+            raise CommandError("Create a status and a user first.")
+        label_id = Label.objects.values_list("pk", flat=True).first()
+
+        # the workers are forked and must not share the parent's connection
+        connections.close_all()
+        started = time.perf_counter()
+        with multiprocessing.get_context("fork").Pool(
+            options["processes"]
+        ) as pool:
+            runs = pool.starmap(
+                create_tasks,
+                [
+                    (worker, options["tasks"], status.pk, user.pk, label_id)
+                    for worker in range(options["processes"])
+                ],
+            )
+        elapsed = time.perf_counter() - started
+
+        timings = [t for run_timings, _ in runs for t in run_timings]
+        if not timings:
+            raise CommandError("Every write failed.")
+        results = {
+            "vendor": connections["default"].vendor,
+            "options": connections["default"].settings_dict["OPTIONS"],
+            "processes": options["processes"],
+            "written": len(timings),
+            "failed": sum(errors for _, errors in runs),
+            "writes_per_second": len(timings) / elapsed,
+            **latency_percentiles(timings),
+        }
+        for name, value in results.items():
+            self.stdout.write(f"{name}: {value}")
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
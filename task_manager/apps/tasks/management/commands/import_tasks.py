@@ -0,0 +1,168 @@
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from task_manager.apps.core.model_versions import bump_version
+from task_manager.apps.labels.models import Label
+from task_manager.apps.statuses.models import Status
+from task_manager.apps.tasks.counters import count_new_tasks
+from task_manager.apps.tasks.models import Task, TasksLabels
+from task_manager.apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks from CSV or NDJSON in the format of the task export "
+        "(name, description, status, author, executor, labels). Statuses, "
+        "users and labels are looked up by name; rows are inserted with "
+        "bulk_create, one transaction per batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to read, '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="Input format (default: from the file extension, else csv).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--author",
+            help="Username to use for rows without an author.",
+        )
+        parser.add_argument(
+            "--create-missing",
+            action="store_true",
+            help="Create unknown statuses and labels instead of skipping.",
+        )
+
+    def handle(self, *args, **options):
+        self.create_missing = options["create_missing"]
+        self.statuses = dict(Status.objects.values_list("name", "pk"))
+        self.labels = dict(Label.objects.values_list("name", "pk"))
+        self.users = dict(User.objects.values_list("username", "pk"))
+        self.default_author = None
+        if options["author"]:
+            self.default_author = self.users.get(options["author"])
+            if self.default_author is None:
+                raise CommandError(f"Unknown user {options['author']!r}.")
+
+        export_format = options["format"] or (
+            "ndjson" if options["path"].endswith(".ndjson") else "csv"
+        )
+        imported = skipped = 0
+        started = time.perf_counter()
+        with self.open(options["path"]) as source:
+            records = getattr(self, f"read_{export_format}")(source)
+            while batch := list(islice(records, options["batch_size"])):
+                tasks, task_labels, batch_skipped = self.build(batch)
+                with transaction.atomic():
+                    Task.objects.bulk_create(tasks)
+                    TasksLabels.objects.bulk_create(
+                        TasksLabels(task_id=task.pk, label_id=label_id)
+                        for task, label_ids in zip(tasks, task_labels)
+                        for label_id in label_ids
+                    )
+                    count_new_tasks(tasks)
+                imported += len(tasks)
+                skipped += batch_skipped
+        elapsed = time.perf_counter() - started
+
+        # bulk_create sends no post_save, so bump the cache stamps here
+        bump_version(Task._meta.label_lower)
+        self.stdout.write(
+            f"Imported {imported} tasks, skipped {skipped} rows in "
+            f"{elapsed:.1f}s ({imported / max(elapsed, 1e-9):.0f} rows/s)."
+        )
+
+    def open(self, path):
+        if path == "-":
+            return open(sys.stdin.fileno(), encoding="utf-8", closefd=False)
+        try:
+            return open(path, encoding="utf-8", newline="")
+        except OSError as error:
+            raise CommandError(error)
+
+    # readers yield (line number, record), the record being a ValueError
+    # for a line that could not be read, so it is skipped like a bad row
+
+    def read_csv(self, source):
+        reader = csv.DictReader(source)
+        for record in reader:
+            labels = record.get("labels") or ""
+            record["labels"] = [
+                name.strip() for name in labels.split(";") if name.strip()
+            ]
+            yield reader.line_num, record
+
+    def read_ndjson(self, source):
+        for line_number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                record = ValueError(f"invalid JSON ({error})")
+            else:
+                if not isinstance(record, dict):
+                    record = ValueError("not a JSON object")
+            yield line_number, record
+
+    def build(self, records):
+        tasks = []
+        task_labels = []
+        skipped = 0
+        for line_number, record in records:
+            try:
+                if isinstance(record, ValueError):
+                    raise record
+                task, label_ids = self.build_task(record)
+            except ValueError as error:
+                skipped += 1
+                where = f"line {line_number}"
+                if isinstance(record, dict) and record.get("name"):
+                    where += f" ({record['name']!r})"
+                self.stderr.write(f"Skipped {where}: {error}")
+                continue
+            tasks.append(task)
+            task_labels.append(label_ids)
+        return tasks, task_labels, skipped
+
+    def build_task(self, record):
+        if not record.get("name"):
+            raise ValueError("no name")
+        author = record.get("author")
+        author_id = self.users.get(author) if author else self.default_author
+        if author_id is None:
+            raise ValueError(f"unknown author {author!r}")
+        executor = record.get("executor")
+        executor_id = self.users.get(executor) if executor else None
+        if executor and executor_id is None:
+            raise ValueError(f"unknown executor {executor!r}")
+        task = Task(
+            name=record["name"],
+            description=record.get("description") or "",
+            status_id=self.lookup(Status, self.statuses, record.get("status")),
+            author_id=author_id,
+            executor_id=executor_id,
+        )
+        label_ids = {
+            self.lookup(Label, self.labels, name)
+            for name in record.get("labels") or []
+        }
+        return task, label_ids
+
+    def lookup(self, model, pks, name):
+        if not name:
+            raise ValueError(f"no {model._meta.model_name}")
+        pk = pks.get(name)
+        if pk is None:
+            if not self.create_missing:
+                raise ValueError(f"unknown {model._meta.model_name} {name!r}")
+            pk = pks[name] = model.objects.create(name=name).pk
+        return pk
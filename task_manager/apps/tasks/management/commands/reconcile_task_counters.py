@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.apps.tasks.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount tasks per status and per executor and fix the counters "
+        "that drifted, e.g. after tasks were changed with QuerySet.update."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the counters that are off.",
+        )
+
+    def handle(self, *args, **options):
+        wrong = reconcile_counters(fix=not options["dry_run"])
+        verb = "Found" if options["dry_run"] else "Fixed"
+        for name, count in wrong.items():
+            self.stdout.write(f"{verb} {count} wrong {name}.")
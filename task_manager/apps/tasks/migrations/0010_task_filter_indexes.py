@@ -0,0 +1,67 @@
+# Generated by Django 5.2.6 on 2026-10-18 16:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def remove_duplicate_task_labels(apps, schema_editor):
+    TasksLabels = apps.get_model('tasks', 'TasksLabels')
+    keep = (
+        TasksLabels.objects.values('task_id', 'label_id')
+        .annotate(keep_id=models.Min('id'))
+        .values('keep_id')
+    )
+    TasksLabels.objects.exclude(id__in=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0002_alter_label_options'),
+        ('statuses', '0002_alter_status_options'),
+        ('tasks', '0009_rename_label_task_labels'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'id'], name='task_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['executor', 'id'], name='task_executor_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['author', 'id'], name='task_author_id_idx'),
+        ),
+        migrations.RunPython(
+            remove_duplicate_task_labels, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='taskslabels',
+            constraint=models.UniqueConstraint(fields=('label', 'task'), name='unique_label_task'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='author',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.RESTRICT, related_name='tasks_created', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='executor',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.RESTRICT, related_name='tasks_to_execute', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.RESTRICT, related_name='tasks_with_status', to='statuses.status'),
+        ),
+        migrations.AlterField(
+            model_name='taskslabels',
+            name='label',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.RESTRICT, to='labels.label'),
+        ),
+    ]
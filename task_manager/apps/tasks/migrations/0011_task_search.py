@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from task_manager.apps.core.operations import AddFullTextSearch
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_task_filter_indexes'),
+    ]
+
+    operations = [
+        AddFullTextSearch(
+            model_name='task',
+            fields={'name': 'A', 'description': 'B'},
+            name='task_search_idx',
+        ),
+    ]
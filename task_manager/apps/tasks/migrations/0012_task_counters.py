@@ -0,0 +1,57 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def count_existing_tasks(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    for counter_name, field in [
+        ('StatusTaskCounter', 'status'),
+        ('ExecutorTaskCounter', 'executor'),
+    ]:
+        counter = apps.get_model('tasks', counter_name)
+        counts = (
+            Task.objects.filter(**{f'{field}__isnull': False})
+            .values_list(field)
+            .annotate(count=models.Count('pk'))
+            .order_by()
+        )
+        counter.objects.bulk_create(
+            counter(**{f'{field}_id': pk, 'count': count})
+            for pk, count in counts
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('statuses', '0003_status_prefix_search_index'),
+        ('tasks', '0011_task_search'),
+        ('users', '0003_user_prefix_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExecutorTaskCounter',
+            fields=[
+                ('count', models.IntegerField(default=0)),
+                ('executor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='executor_task_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='StatusTaskCounter',
+            fields=[
+                ('count', models.IntegerField(default=0)),
+                ('status', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_counter', serialize=False, to='statuses.status')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(count_existing_tasks, migrations.RunPython.noop),
+    ]
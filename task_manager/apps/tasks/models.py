@@ -1,26 +1,53 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 
+from task_manager.apps.core.search import full_text_search
 from task_manager.apps.labels.models import Label
 from task_manager.apps.statuses.models import Status
+from task_manager.apps.tasks.counters import (
+    counted_values,
+    has_counted_values,
+)
 
 User = get_user_model()
 
 
+class TaskChangedError(Exception):
+    """The task was saved by someone else since it was read."""
+
+
+class TaskQuerySet(models.QuerySet):
+    def with_related(self):
+        return self.select_related(
+            "status", "author", "executor"
+        ).prefetch_related("labels")
+
+    def search(self, term):
+        """Tasks matching ``term`` in name or description, best first."""
+        return full_text_search(self, term, ["name", "description"])
+
+
 class Task(models.Model):
     name = models.CharField(max_length=150)
     description = models.TextField(blank=True)
     status = models.ForeignKey(
-        Status, on_delete=models.RESTRICT, related_name="tasks_with_status"
+        Status,
+        on_delete=models.RESTRICT,
+        related_name="tasks_with_status",
+        db_index=False,
     )
     executor = models.ForeignKey(
         User,
         on_delete=models.RESTRICT,
         null=True,
         related_name="tasks_to_execute",
+        db_index=False,
     )
     author = models.ForeignKey(
-        User, on_delete=models.RESTRICT, related_name="tasks_created"
+        User,
+        on_delete=models.RESTRICT,
+        related_name="tasks_created",
+        db_index=False,
     )
     labels = models.ManyToManyField(
         Label,
@@ -31,13 +58,117 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         ordering = ["pk"]
+        # TaskFilterForm filters by one of these columns and pages by pk,
+        # the composite indexes also serve the foreign key lookups.
+        indexes = [
+            models.Index(fields=["status", "id"], name="task_status_id_idx"),
+            models.Index(
+                fields=["executor", "id"], name="task_executor_id_idx"
+            ),
+            models.Index(fields=["author", "id"], name="task_author_id_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save_if_unchanged(self, version, **kwargs) -> None:
+        """Save only if the row still has ``updated_at == version``.
+
+        The update is a single ``UPDATE ... WHERE updated_at = version``, so
+        no row stays locked while the user edits the task. Raises
+        ``TaskChangedError`` when another save came first.
+        """
+        self._expected_version = version
+        try:
+            # a savepoint, so a conflict does not break an outer transaction
+            with transaction.atomic():
+                self.save(force_update=True, **kwargs)
+        finally:
+            del self._expected_version
+
+    def _do_update(
+        self, base_qs, using, pk_val, values, update_fields, forced_update
+    ):
+        version = getattr(self, "_expected_version", None)
+        if version is not None:
+            base_qs = base_qs.filter(updated_at=version)
+        updated = super()._do_update(
+            base_qs, using, pk_val, values, update_fields, forced_update
+        )
+        if version is not None and not updated:
+            raise TaskChangedError(self.pk)
+        return updated
+
+    def set_labels(self, labels) -> None:
+        """Link the task to exactly ``labels``, writing only what changed."""
+        wanted = {label.pk for label in labels}
+        current = set(
+            TasksLabels.objects.filter(task=self).values_list(
+                "label_id", flat=True
+            )
+        )
+        added = wanted - current
+        removed = current - wanted
+        if not (added or removed):
+            return
+        with transaction.atomic():
+            if removed:
+                TasksLabels.objects.filter(
+                    task=self, label_id__in=removed
+                ).delete()
+            if added:
+                TasksLabels.objects.bulk_create(
+                    [TasksLabels(task=self, label_id=pk) for pk in added],
+                    # a concurrent save may have linked some of them already
+                    ignore_conflicts=True,
+                )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # what the task counters have this task counted as; with a counted
+        # field deferred by only() or defer() it is looked up before saving
+        if has_counted_values(instance):
+            instance._counted_as = counted_values(instance)
+        return instance
+
+
+class TaskCounter(models.Model):
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class StatusTaskCounter(TaskCounter):
+    status = models.OneToOneField(
+        Status,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="task_counter",
+    )
+
+
+class ExecutorTaskCounter(TaskCounter):
+    executor = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="executor_task_counter",
+    )
+
 
 class TasksLabels(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
-    label = models.ForeignKey(Label, on_delete=models.RESTRICT)
+    label = models.ForeignKey(Label, on_delete=models.RESTRICT, db_index=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["label", "task"], name="unique_label_task"
+            ),
+        ]
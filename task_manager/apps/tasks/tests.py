@@ -1,9 +1,38 @@
+import csv
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import skipUnless
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DatabaseError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.translation import gettext
 
 from task_manager.apps.core import text_constants
-from task_manager.apps.tasks.models import Task
+from task_manager.apps.core.pagination import FORWARD, OFFSET, encode_cursor
+from task_manager.apps.core.query_budget import (
+    BUDGET_USERNAME,
+    QueryBudgetTestMixin,
+)
+from task_manager.apps.core.search import SEARCH_VECTOR_COLUMN
+from task_manager.apps.core.views import AutocompleteView
+from task_manager.apps.labels.models import Label
+from task_manager.apps.tasks.forms import TaskForm
+from task_manager.apps.tasks.models import (
+    ExecutorTaskCounter,
+    StatusTaskCounter,
+    Task,
+    TaskChangedError,
+    TasksLabels,
+)
+from task_manager.apps.tasks.views import TaskExportView, TaskIndexView
 
 
 class TasksTest(TestCase):
@@ -143,6 +172,81 @@ class TasksTest(TestCase):
         actual_tasks_count = len(response.context["tasks"])
         self.assertEqual(actual_tasks_count, self.full_filter_tasks_count)
 
+    def test_tasks_index_query_count_is_constant(self):
+        urls = [self.tasks_index_url, self.tasks_filter_full_url]
+        for url in urls:
+            with self.subTest(url=url):
+                self.client.get(url)
+                with CaptureQueriesContext(connection) as small:
+                    self.client.get(url)
+                Task.objects.bulk_create(
+                    Task(
+                        name=f"Bulk task {i}",
+                        status_id=1,
+                        executor_id=1,
+                        author_id=4,
+                    )
+                    for i in range(20)
+                )
+                with CaptureQueriesContext(connection) as large:
+                    self.client.get(url)
+                self.assertEqual(len(large), len(small))
+
+    def test_tasks_forms_do_not_load_choice_lists(self):
+        # the autocomplete widgets render only the selected options
+        for url in [self.tasks_create_url, self.tasks_index_url]:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    self.client.get(url)
+                sqls = [query["sql"] for query in queries]
+                for table in ['"statuses_status"', '"labels_label"']:
+                    self.assertFalse(
+                        any(sql.startswith(f"SELECT {table}") for sql in sqls)
+                    )
+
+        self.client.post(
+            reverse("statuses_update", kwargs={"pk": 1}),
+            data={"name": "Fresh status"},
+        )
+        response = self.client.get(self.tasks_update_url)
+        self.assertContains(
+            response, '<option value="1" selected>Fresh status</option>'
+        )
+
+    def test_tasks_form_loads_only_selected_users(self):
+        user = get_user_model()
+        user.objects.bulk_create(
+            user(username=f"bulk_user_{i}", first_name="Bulk")
+            for i in range(50)
+        )
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.tasks_update_url)
+        self.assertContains(response, '<option value="2" selected>')
+        self.assertNotContains(response, "Bulk")
+        user_queries = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "users_user"')
+        ]
+        self.assertTrue(user_queries)
+        for sql in user_queries:
+            self.assertIn("WHERE", sql)
+
+    def test_tasks_index_shows_related_edits(self):
+        self.client.get(self.tasks_index_url)
+        self.client.post(
+            reverse("statuses_update", kwargs={"pk": 1}),
+            data={"name": "Renamed status"},
+        )
+        self.client.post(
+            self.tasks_update_url,
+            data={**self.new_task_data, "name": "Renamed task"},
+        )
+        response = self.client.get(self.tasks_index_url)
+        self.assertContains(response, "Renamed status")
+        self.assertContains(response, "Renamed task")
+
     def test_tasks_user_delete_restrict(self):
         self.client.post(
             self.tasks_create_url, data=self.new_task_data, follow=True
@@ -165,6 +269,707 @@ class TasksTest(TestCase):
         self.assertContains(response, text_constants.LABEL_RESTRICT_DELETE)
 
 
+class TasksSearchTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json"]
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    def setUp(self):
+        user = get_user_model()
+        user.objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+
+    def search(self, url_name, **params):
+        response = self.client.get(reverse(url_name), query_params=params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_search_by_prefix(self):
+        cases = [
+            ("users_search", "bo", ["Bob Johnson"]),
+            ("users_search", "BROWN", ["Charlie Brown"]),
+            ("statuses_search", "in", ["In Progress"]),
+            ("labels_search", "do", ["Documentation"]),
+        ]
+        for url_name, term, expected in cases:
+            with self.subTest(url_name=url_name, term=term):
+                data = self.search(url_name, q=term)
+                texts = [item["text"] for item in data["results"]]
+                self.assertEqual(texts, expected)
+
+    def test_search_pages(self):
+        with patch.object(AutocompleteView, "page_size", 2):
+            first = self.search("labels_search")
+            second = self.search("labels_search", cursor=first["next"])
+        self.assertEqual(len(first["results"]), 2)
+        self.assertEqual(len(second["results"]), 1)
+        self.assertIsNone(second["next"])
+
+    def test_task_form_renders_only_selected_options(self):
+        response = self.client.get(reverse("tasks_create"))
+        self.assertNotContains(response, "Alice Smith")
+        self.assertContains(response, reverse("users_search"))
+
+
+class TasksFullTextSearchTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    tasks_index_url = reverse("tasks_index")
+
+    def setUp(self):
+        user = get_user_model()
+        user.objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+
+    def create_task(self, name, description=""):
+        return Task.objects.create(
+            name=name, description=description, status_id=1, author_id=1
+        )
+
+    def test_name_matches_rank_above_description_matches(self):
+        in_description = self.create_task("Hangar", "Inspect the zeppelin")
+        in_name = self.create_task("Zeppelin launch")
+        self.assertEqual(
+            list(Task.objects.search("zeppelin")), [in_name, in_description]
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL search")
+    def test_postgresql_search_ranks_the_search_vector(self):
+        in_description = self.create_task("Hangar", "Inspect the zeppelin")
+        in_name = self.create_task("Zeppelin launch")
+        with CaptureQueriesContext(connection) as queries:
+            found = list(Task.objects.search("zeppelin"))
+        self.assertEqual(found, [in_name, in_description])
+        self.assertIn(f'"{SEARCH_VECTOR_COLUMN}"', queries[0]["sql"])
+        self.assertIn("ts_rank", queries[0]["sql"])
+        self.assertEqual(
+            list(Task.objects.search("zeppelin -launch")), [in_description]
+        )
+
+    def test_search_follows_updates_and_deletes(self):
+        task = Task.objects.get(pk=4)
+        self.assertEqual(list(Task.objects.search("module")), [task])
+        task.name = "Rewrite parser"
+        task.description = ""
+        task.save()
+        self.assertFalse(Task.objects.search("module").exists())
+        self.assertEqual(list(Task.objects.search("parser")), [task])
+        task.delete()
+        self.assertFalse(Task.objects.search("parser").exists())
+
+    def test_search_needs_every_word(self):
+        self.assertEqual(
+            list(
+                Task.objects.search("weekly REPORT").values_list(
+                    "pk", flat=True
+                )
+            ),
+            [1],
+        )
+        self.assertFalse(Task.objects.search("weekly bug").exists())
+        self.assertFalse(Task.objects.search('" *').exists())
+
+    def test_index_shows_ranked_matches(self):
+        response = self.client.get(
+            self.tasks_index_url, query_params={"search": "code", "status": 1}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task.pk for task in response.context["tasks"]], [2])
+        self.assertFalse(response.context["is_paginated"])
+
+        response = self.client.get(
+            self.tasks_index_url, query_params={"search": "code", "status": 2}
+        )
+        self.assertEqual(list(response.context["tasks"]), [])
+
+    def test_index_pages_through_ranked_matches(self):
+        in_description = [
+            self.create_task(f"Hangar {i}", "Inspect the zeppelin")
+            for i in range(2)
+        ]
+        in_name = self.create_task("Zeppelin launch")
+        params = {"search": "zeppelin"}
+        with patch.object(TaskIndexView, "paginate_by", 2):
+            first = self.client.get(self.tasks_index_url, query_params=params)
+            second = self.client.get(
+                f"{self.tasks_index_url}?{first.context['next_page_query']}"
+            )
+            back = self.client.get(
+                f"{self.tasks_index_url}?{second.context['previous_page_query']}"
+            )
+        self.assertEqual(
+            list(first.context["tasks"]), [in_name, in_description[0]]
+        )
+        self.assertEqual(list(second.context["tasks"]), [in_description[1]])
+        self.assertIsNone(second.context["next_page_query"])
+        self.assertEqual(
+            list(back.context["tasks"]), list(first.context["tasks"])
+        )
+
+        response = self.client.get(
+            self.tasks_index_url,
+            query_params={**params, "cursor": encode_cursor(FORWARD, 1)},
+        )
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.get(
+            self.tasks_index_url,
+            query_params={**params, "cursor": encode_cursor(OFFSET, -5)},
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_applies_search(self):
+        response = self.client.get(
+            reverse("tasks_export"),
+            query_params={"search": "bug", "format": "ndjson"},
+        )
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual([row["id"] for row in rows], [3])
+
+
+class TaskCountersTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    def setUp(self):
+        user = get_user_model()
+        self.user = user.objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+
+    def counts(self):
+        return (
+            dict(StatusTaskCounter.objects.values_list("pk", "count")),
+            dict(ExecutorTaskCounter.objects.values_list("pk", "count")),
+        )
+
+    def test_views_keep_counters_current(self):
+        self.assertEqual(
+            self.counts(), ({1: 1, 2: 2, 3: 1}, {1: 1, 2: 2, 3: 1})
+        )
+
+        self.client.post(
+            reverse("tasks_create"),
+            {"name": "Counted", "description": "", "status": 3, "executor": 3},
+        )
+        task = Task.objects.get(name="Counted")
+        self.assertEqual(
+            self.counts(), ({1: 1, 2: 2, 3: 2}, {1: 1, 2: 2, 3: 2})
+        )
+
+        self.client.post(
+            reverse("tasks_update", args=[task.pk]),
+            {"name": "Counted", "description": "", "status": 1, "executor": 2},
+        )
+        self.assertEqual(
+            self.counts(), ({1: 2, 2: 2, 3: 1}, {1: 1, 2: 3, 3: 1})
+        )
+
+        self.client.post(reverse("tasks_delete", args=[task.pk]))
+        self.assertEqual(
+            self.counts(), ({1: 1, 2: 2, 3: 1}, {1: 1, 2: 2, 3: 1})
+        )
+
+    def test_tasks_loaded_with_deferred_fields_keep_counters_current(self):
+        task = Task.objects.only("name").get(pk=1)
+        old_status, old_executor = task.status_id, task.executor_id
+        task.status_id, task.executor_id = 3, 3
+        task.save()
+        counts = ({1: 1, 2: 2, 3: 1}, {1: 1, 2: 2, 3: 1})
+        for counter, old_pk in zip(counts, [old_status, old_executor]):
+            counter[old_pk] -= 1
+            counter[3] += 1
+        self.assertEqual(self.counts(), counts)
+
+        Task.objects.defer("status", "executor").get(pk=1).delete()
+        for counter in counts:
+            counter[3] -= 1
+        self.assertEqual(self.counts(), counts)
+
+    def test_index_pages_show_counts(self):
+        response = self.client.get(reverse("statuses_index"))
+        self.assertEqual(
+            {
+                status.pk: status.task_count
+                for status in response.context["statuses"]
+            },
+            {1: 1, 2: 2, 3: 1},
+        )
+        response = self.client.get(reverse("users_index"))
+        self.assertEqual(
+            {user.pk: user.task_count for user in response.context["users"]},
+            {1: 1, 2: 2, 3: 1, self.user.pk: 0},
+        )
+
+    def test_reconcile_fixes_drift(self):
+        # QuerySet.update sends no signals
+        Task.objects.filter(pk=1).update(status_id=3, executor_id=None)
+        output = StringIO()
+        call_command("reconcile_task_counters", dry_run=True, stdout=output)
+        self.assertIn("Found 2 wrong status task counters.", output.getvalue())
+        self.assertIn(
+            "Found 1 wrong executor task counters.", output.getvalue()
+        )
+        self.assertEqual(StatusTaskCounter.objects.get(pk=3).count, 1)
+
+        call_command("reconcile_task_counters", stdout=StringIO())
+        self.assertEqual(
+            self.counts(), ({1: 1, 2: 1, 3: 2}, {1: 0, 2: 2, 3: 1})
+        )
+
+    def test_import_counts_bulk_created_tasks(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as source:
+            source.write(
+                json.dumps(
+                    {"name": "Bulk", "status": "Done", "author": "user1"}
+                )
+            )
+            source.flush()
+            call_command("import_tasks", source.name, stdout=StringIO())
+        self.assertEqual(StatusTaskCounter.objects.get(pk=3).count, 2)
+
+
+class TaskLabelsSaveTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+    task_data = {
+        "name": "Complete Report",
+        "description": "Prepare and submit the weekly status report.",
+        "status": 2,
+        "executor": 1,
+        "labels": [1, 2],
+    }
+    tasks_update_url = reverse("tasks_update", kwargs={"pk": 1})
+
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.get(pk=1))
+
+    def label_writes(self, **changes):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                self.tasks_update_url, {**self.task_data, **changes}
+            )
+        self.assertRedirects(
+            response, reverse("tasks_index"), fetch_redirect_response=False
+        )
+        return [
+            query["sql"].split()[0]
+            for query in context.captured_queries
+            if "tasks_taskslabels" in query["sql"]
+            and not query["sql"].startswith("SELECT")
+        ]
+
+    def task_label_ids(self):
+        return set(
+            TasksLabels.objects.filter(task_id=1).values_list(
+                "label_id", flat=True
+            )
+        )
+
+    def test_unchanged_labels_are_not_written(self):
+        self.assertEqual(self.label_writes(), [])
+        self.assertEqual(self.task_label_ids(), {1, 2})
+
+    def test_changed_labels_are_diffed(self):
+        self.assertEqual(self.label_writes(labels=[2, 3]), ["DELETE", "INSERT"])
+        self.assertEqual(self.task_label_ids(), {2, 3})
+        self.assertEqual(self.label_writes(labels=[]), ["DELETE"])
+        self.assertEqual(self.task_label_ids(), set())
+
+
+class TaskOptimisticLockingTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+    task_data = {
+        "name": "Complete Report",
+        "description": "Prepare and submit the weekly status report.",
+        "status": 2,
+        "executor": 1,
+        "labels": [1, 2],
+    }
+    tasks_update_url = reverse("tasks_update", kwargs={"pk": 1})
+
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.get(pk=1))
+
+    def shown_version(self):
+        response = self.client.get(self.tasks_update_url)
+        return response.context["form"]["version"].value()
+
+    def update(self, version, **changes):
+        return self.client.post(
+            self.tasks_update_url,
+            {**self.task_data, "version": version, **changes},
+        )
+
+    def test_form_carries_the_version(self):
+        self.assertEqual(
+            self.shown_version(), Task.objects.get(pk=1).updated_at.isoformat()
+        )
+
+    def test_stale_version_is_reported_and_not_saved(self):
+        first_editor = self.shown_version()
+        second_editor = self.shown_version()
+        response = self.update(first_editor, name="First")
+        self.assertRedirects(
+            response, reverse("tasks_index"), fetch_redirect_response=False
+        )
+
+        response = self.update(second_editor, name="Second", labels=[3])
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, text_constants.TASK_UPDATE_CONFLICT)
+        task = Task.objects.get(pk=1)
+        self.assertEqual(task.name, "First")
+        self.assertEqual(
+            sorted(task.labels.values_list("pk", flat=True)), [1, 2]
+        )
+
+        # the form now carries the current version, so saving overwrites
+        refreshed = response.context["form"]["version"].value()
+        self.assertEqual(refreshed, task.updated_at.isoformat())
+        self.assertEqual(response.context["form"]["name"].value(), "Second")
+        response = self.update(refreshed, name="Second")
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Task.objects.get(pk=1).name, "Second")
+
+    def test_invalid_version_is_reported(self):
+        for version in ["yesterday", "2020-01-01T00:00:00"]:
+            with self.subTest(version=version):
+                response = self.update(version, name="Renamed")
+                self.assertEqual(response.status_code, 200)
+                self.assertContains(response, gettext("Invalid version."))
+                self.assertEqual(Task.objects.get(pk=1).name, "Complete Report")
+
+    def test_task_deleted_while_editing_is_reported(self):
+        version = self.shown_version()
+        save = TaskForm.save
+
+        def delete_then_save(form, *args, **kwargs):
+            Task.objects.filter(pk=1).delete()
+            return save(form, *args, **kwargs)
+
+        with patch.object(TaskForm, "save", delete_then_save):
+            response = self.update(version, name="Renamed")
+        self.assertRedirects(
+            response, reverse("tasks_index"), fetch_redirect_response=False
+        )
+        response = self.client.get(response.url)
+        self.assertContains(response, text_constants.TASK_UPDATE_DELETED)
+        self.assertFalse(Task.objects.filter(pk=1).exists())
+
+    def test_labels_roll_back_with_a_failed_save(self):
+        task = Task.objects.get(pk=1)
+        version = task.updated_at
+        form = TaskForm(
+            {**self.task_data, "name": "Renamed", "version": version},
+            instance=task,
+        )
+        self.assertTrue(form.is_valid())
+        with (
+            patch.object(Task, "set_labels", side_effect=DatabaseError),
+            self.assertRaises(DatabaseError),
+        ):
+            form.save()
+        task = Task.objects.get(pk=1)
+        self.assertEqual(task.name, "Complete Report")
+        self.assertEqual(task.updated_at, version)
+
+    def test_save_if_unchanged(self):
+        task = Task.objects.get(pk=1)
+        version = task.updated_at
+        Task.objects.get(pk=1).save()
+        task.name = "Stale"
+        with self.assertRaises(TaskChangedError):
+            task.save_if_unchanged(version)
+        self.assertEqual(Task.objects.get(pk=1).name, "Complete Report")
+
+        fresh = Task.objects.get(pk=1)
+        fresh.name = "Fresh"
+        fresh.save_if_unchanged(fresh.updated_at)
+        self.assertEqual(Task.objects.get(pk=1).name, "Fresh")
+
+
+class TasksExportTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    tasks_export_url = reverse("tasks_export")
+
+    def setUp(self):
+        user = get_user_model()
+        user.objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+
+    def export(self, **params):
+        response = self.client.get(self.tasks_export_url, query_params=params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_csv(self):
+        rows = list(csv.reader(self.export().splitlines()))
+        self.assertEqual(rows[0], TaskExportView.columns)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(
+            rows[1][:7],
+            [
+                "1",
+                "Complete Report",
+                "Prepare and submit the weekly status report.",
+                "In Progress",
+                "user1",
+                "user1",
+                "Urgent; Development",
+            ],
+        )
+
+    def test_export_ndjson_uses_task_filters(self):
+        lines = self.export(format="ndjson", status=2, label=1).splitlines()
+        tasks = [json.loads(line) for line in lines]
+        self.assertEqual([task["id"] for task in tasks], [1])
+        self.assertEqual(tasks[0]["labels"], ["Urgent", "Development"])
+
+    def test_export_reads_in_chunks(self):
+        status = Task.objects.get(pk=1).status
+        author = get_user_model().objects.get(pk=1)
+        Task.objects.bulk_create(
+            Task(name=f"Task {number}", status=status, author=author)
+            for number in range(10)
+        )
+        with (
+            patch.object(TaskExportView, "chunk_size", 5),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            lines = self.export(format="ndjson").splitlines()
+        self.assertEqual(len(lines), 14)
+        label_queries = [
+            query
+            for query in queries.captured_queries
+            if 'FROM "tasks_taskslabels"' in query["sql"]
+        ]
+        # one labels query per chunk of 5 tasks
+        self.assertEqual(len(label_queries), 3)
+
+    def test_export_rejects_bad_input(self):
+        for params in [{"format": "xml"}, {"status": "x"}]:
+            with self.subTest(params=params):
+                response = self.client.get(
+                    self.tasks_export_url, query_params=params
+                )
+                self.assertEqual(response.status_code, 400)
+
+    def test_index_links_to_filtered_export(self):
+        response = self.client.get(
+            reverse("tasks_index"), query_params={"status": 2}
+        )
+        self.assertContains(
+            response, f"{self.tasks_export_url}?status=2&amp;format=csv"
+        )
+
+
+class ImportTasksTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json"]
+
+    def import_tasks(self, content, suffix, *args):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / f"tasks{suffix}"
+        path.write_text(content)
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "import_tasks", str(path), *args, stdout=stdout, stderr=stderr
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_csv(self):
+        output, _ = self.import_tasks(
+            "name,description,status,author,executor,labels\n"
+            "First,One,To Do,user1,user2,Urgent; Development\n"
+            "Second,,Done,user2,,\n",
+            ".csv",
+            "--batch-size",
+            "1",
+        )
+        self.assertIn("Imported 2 tasks, skipped 0 rows", output)
+        first = Task.objects.get(name="First")
+        self.assertEqual(first.status.name, "To Do")
+        self.assertEqual(first.executor.username, "user2")
+        self.assertEqual(
+            sorted(first.labels.values_list("name", flat=True)),
+            ["Development", "Urgent"],
+        )
+        second = Task.objects.get(name="Second")
+        self.assertIsNone(second.executor)
+        self.assertFalse(second.labels.exists())
+
+    def test_import_ndjson_skips_unknown_names(self):
+        rows = [
+            {"name": "Known", "status": "Done", "author": "user1"},
+            {"name": "Bad status", "status": "Nope", "author": "user1"},
+            {"name": "Bad author", "status": "Done", "author": "ghost"},
+        ]
+        output, errors = self.import_tasks(
+            "\n".join(json.dumps(row) for row in rows), ".ndjson"
+        )
+        self.assertIn("Imported 1 tasks, skipped 2 rows", output)
+        self.assertIn("unknown status 'Nope'", errors)
+        self.assertIn("unknown author 'ghost'", errors)
+        self.assertEqual(
+            list(Task.objects.values_list("name", flat=True)), ["Known"]
+        )
+
+    def test_import_ndjson_skips_unreadable_lines(self):
+        lines = [
+            json.dumps({"name": "Before", "status": "Done"}),
+            '{"name": "Broken',
+            "[1]",
+            '"x"',
+            json.dumps({"name": "After", "status": "Done"}),
+        ]
+        output, errors = self.import_tasks(
+            "\n".join(lines), ".ndjson", "--author", "user1"
+        )
+        self.assertIn("Imported 2 tasks, skipped 3 rows", output)
+        self.assertIn("Skipped line 2: invalid JSON", errors)
+        self.assertIn("Skipped line 3: not a JSON object", errors)
+        self.assertIn("Skipped line 4: not a JSON object", errors)
+        self.assertEqual(
+            sorted(Task.objects.values_list("name", flat=True)),
+            ["After", "Before"],
+        )
+
+    def test_import_creates_missing_labels(self):
+        row = {
+            "name": "Labelled",
+            "status": "Done",
+            "labels": ["Urgent", "Brand new"],
+        }
+        self.import_tasks(
+            json.dumps(row),
+            ".ndjson",
+            "--author",
+            "user1",
+            "--create-missing",
+        )
+        self.assertTrue(Label.objects.filter(name="Brand new").exists())
+        self.assertEqual(TasksLabels.objects.count(), 2)
+
+    def test_export_round_trips_through_import(self):
+        call_command("loaddata", "tasks.json", verbosity=0)
+        user = get_user_model().objects.get(pk=1)
+        self.client.force_login(user)
+        response = self.client.get(reverse("tasks_export"))
+        exported = b"".join(response.streaming_content).decode()
+
+        self.import_tasks(exported, ".csv")
+        self.assertEqual(Task.objects.count(), 8)
+        self.assertEqual(TasksLabels.objects.count(), 10)
+
+
+class TasksPaginationTest(TestCase):
+    fixtures = ["users.json", "statuses.json", "labels.json", "tasks.json"]
+    page_size = 2
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    tasks_index_url = reverse("tasks_index")
+    tasks_filter_status_url = reverse("tasks_index", query={"status": 1})
+
+    def setUp(self):
+        user = get_user_model()
+        user.objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        Task.objects.bulk_create(
+            Task(name=f"Task {i}", status_id=i % 2 + 1, author_id=1)
+            for i in range(6)
+        )
+        self.status_task_ids = list(
+            Task.objects.filter(status_id=1).values_list("pk", flat=True)
+        )
+        patcher = patch.object(TaskIndexView, "paginate_by", self.page_size)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_page(self, query):
+        response = self.client.get(f"{self.tasks_index_url}?{query}")
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_tasks_pages_forward_and_back_with_filter(self):
+        pages = []
+        response = self.client.get(self.tasks_filter_status_url)
+        self.assertIsNone(response.context["previous_page_query"])
+        while True:
+            pages.append([task.pk for task in response.context["tasks"]])
+            if response.context["next_page_query"] is None:
+                break
+            response = self.get_page(response.context["next_page_query"])
+
+        self.assertTrue(all(len(page) <= self.page_size for page in pages))
+        self.assertEqual(sum(pages, []), self.status_task_ids)
+
+        response = self.get_page(response.context["previous_page_query"])
+        self.assertEqual(
+            [task.pk for task in response.context["tasks"]], pages[-2]
+        )
+
+    def test_tasks_pages_back_to_the_start(self):
+        pages = []
+        response = self.client.get(self.tasks_index_url)
+        while True:
+            pages.append([task.pk for task in response.context["tasks"]])
+            if response.context["next_page_query"] is None:
+                break
+            response = self.get_page(response.context["next_page_query"])
+        last_page = response
+
+        for page in reversed(pages[:-1]):
+            response = self.get_page(response.context["previous_page_query"])
+            self.assertEqual(
+                [task.pk for task in response.context["tasks"]], page
+            )
+            self.assertIsNotNone(response.context["next_page_query"])
+        self.assertIsNone(response.context["previous_page_query"])
+
+        # nothing left after the previous page once the last one is gone
+        Task.objects.filter(pk__in=pages[-1]).delete()
+        response = self.get_page(last_page.context["previous_page_query"])
+        self.assertEqual(
+            [task.pk for task in response.context["tasks"]], pages[-2]
+        )
+        self.assertIsNone(response.context["next_page_query"])
+
+    def test_tasks_invalid_cursor(self):
+        response = self.client.get(
+            self.tasks_index_url, query_params={"cursor": "not-a-cursor"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+
 class UnAuthenticatedTasksTest(TestCase):
     login_url = reverse("login")
     urls = [
@@ -180,3 +985,18 @@ class UnAuthenticatedTasksTest(TestCase):
                 response = self.client.get(url, follow=True)
                 self.assertRedirects(response, f"{login_url}?next={url}")
                 self.assertContains(response, text_constants.LOGIN_REQUIRED)
+
+
+class TasksQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    query_budgets = {
+        "tasks_index": 7,
+        "tasks_detail": 4,
+        "tasks_create": 5,
+        "tasks_update": 7,
+        "tasks_delete": 5,
+    }
+
+    # only the author may open the delete page
+    budget_object = Task.objects.filter(
+        author__username=BUDGET_USERNAME
+    ).order_by("pk")
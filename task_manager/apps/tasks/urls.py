@@ -5,6 +5,7 @@ from task_manager.apps.tasks.views import (
     TaskCreateView,
     TaskDeleteView,
     TaskDetailView,
+    TaskExportView,
     TaskIndexView,
     TaskUpdateView,
 )
@@ -15,6 +16,7 @@ urlpatterns = [
         TaskIndexView.as_view(filterset_class=TaskFilterForm),
         name="tasks_index",
     ),
+    path("export/", TaskExportView.as_view(), name="tasks_export"),
     path("create/", TaskCreateView.as_view(), name="tasks_create"),
     path("<int:pk>/update/", TaskUpdateView.as_view(), name="tasks_update"),
     path("<int:pk>/delete/", TaskDeleteView.as_view(), name="tasks_delete"),
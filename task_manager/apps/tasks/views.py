@@ -1,19 +1,179 @@
+import csv
+import json
+from collections import defaultdict
+from itertools import islice
+
+from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import redirect
 from django.urls import reverse_lazy
+from django.views import View
 from django.views.generic import CreateView, DeleteView, DetailView, UpdateView
-from django_filters.views import FilterView
+from django_filters.views import FilterMixin, FilterView
 
 from task_manager.apps.core import text_constants
-from task_manager.apps.core.mixins import UserIsTaskAuthorMixin
-from task_manager.apps.tasks.forms import TaskForm
-from task_manager.apps.tasks.models import Task
+from task_manager.apps.core.mixins import (
+    KeysetPaginationMixin,
+    ReadReplicaMixin,
+    UserIsTaskAuthorMixin,
+)
+from task_manager.apps.core.pagination import paginate_offset
+from task_manager.apps.tasks.forms import TaskFilterForm, TaskForm
+from task_manager.apps.tasks.models import Task, TaskChangedError, TasksLabels
 
 
-class TaskIndexView(FilterView):
+class TaskIndexView(ReadReplicaMixin, KeysetPaginationMixin, FilterView):
     model = Task
     template_name = "tasks/index.html"
     context_object_name = "tasks"
 
+    def get_queryset(self):
+        return super().get_queryset().with_related()
+
+    def get_paginate_function(self):
+        if self.filterset.is_bound and self.filterset.form.cleaned_data.get(
+            "search"
+        ):
+            # ranked results have no pk order to seek through
+            return paginate_offset
+        return super().get_paginate_function()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.copy()
+        query.pop(self.cursor_kwarg, None)
+        for export_format in TaskExportView.formats:
+            query["format"] = export_format
+            context[f"export_{export_format}_query"] = query.urlencode()
+        return context
+
+
+class _Echo:
+    """File-like object handing back what csv.writer writes."""
+
+    def write(self, value):
+        return value
+
+
+class TaskExportView(ReadReplicaMixin, FilterMixin, View):
+    """Stream the filtered task list as CSV or JSON lines.
+
+    Rows are read ``chunk_size`` at a time through a server-side cursor and
+    the label names of each chunk are fetched in one query, then written
+    out as they arrive, so memory stays flat however many tasks match.
+    Rows are plain tuples: building model instances was most of the cost.
+    """
+
+    filterset_class = TaskFilterForm
+    chunk_size = 2000
+    columns = [
+        "id",
+        "name",
+        "description",
+        "status",
+        "author",
+        "executor",
+        "labels",
+        "created_at",
+    ]
+    fields = [
+        "pk",
+        "name",
+        "description",
+        "status__name",
+        "author__username",
+        "executor__username",
+        "created_at",
+    ]
+    formats = {
+        "csv": "text/csv; charset=utf-8",
+        "ndjson": "application/x-ndjson",
+    }
+
+    def get_queryset(self):
+        return Task.objects.order_by("pk")
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
+        if export_format not in self.formats:
+            return JsonResponse(
+                {"format": [f"Use one of: {', '.join(self.formats)}."]},
+                status=400,
+            )
+        filterset = self.get_filterset(self.get_filterset_class())
+        if filterset.is_bound and not filterset.is_valid():
+            return JsonResponse(filterset.errors, status=400)
+        queryset = filterset.qs
+        # the body is streamed after the request has left the middleware,
+        # so pick the database (a replica, here) while still inside it
+        queryset = queryset.using(queryset.db)
+
+        rows = getattr(self, f"{export_format}_lines")(self.rows(queryset))
+        response = StreamingHttpResponse(
+            self.batched(rows), content_type=self.formats[export_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="tasks.{export_format}"'
+        )
+        return response
+
+    def rows(self, queryset):
+        values = queryset.values_list(*self.fields).iterator(
+            chunk_size=self.chunk_size
+        )
+        while chunk := list(islice(values, self.chunk_size)):
+            labels = defaultdict(list)
+            task_labels = (
+                TasksLabels.objects.using(queryset.db)
+                .filter(task_id__in=[row[0] for row in chunk])
+                .order_by("pk")
+                .values_list("task_id", "label__name")
+            )
+            for task_id, label_name in task_labels:
+                labels[task_id].append(label_name)
+            for (
+                pk,
+                name,
+                description,
+                status,
+                author,
+                executor,
+                created,
+            ) in chunk:
+                yield [
+                    pk,
+                    name,
+                    description,
+                    status,
+                    author,
+                    executor or "",
+                    labels[pk],
+                    created.isoformat(),
+                ]
+
+    def csv_lines(self, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(self.columns)
+        for row in rows:
+            row[6] = "; ".join(row[6])
+            yield writer.writerow(row)
+
+    def ndjson_lines(self, rows):
+        for row in rows:
+            yield json.dumps(dict(zip(self.columns, row))) + "\n"
+
+    def batched(self, lines):
+        # one write per row would mean one socket send per row
+        batch = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) == self.chunk_size:
+                yield "".join(batch)
+                batch = []
+        if batch:
+            yield "".join(batch)
+
 
 class TaskCreateView(SuccessMessageMixin, CreateView):
     model = Task
@@ -37,6 +197,24 @@ class TaskUpdateView(
     template_name = "tasks/update.html"
     success_url = reverse_lazy("tasks_index")
 
+    def form_valid(self, form):
+        try:
+            return super().form_valid(form)
+        except TaskChangedError:
+            current_version = (
+                Task.objects.filter(pk=self.object.pk)
+                .values_list("updated_at", flat=True)
+                .first()
+            )
+            if current_version is None:
+                messages.error(self.request, text_constants.TASK_UPDATE_DELETED)
+                return redirect(self.success_url)
+            form.add_error(None, text_constants.TASK_UPDATE_CONFLICT)
+            # keep what the user typed; saving again overwrites knowingly
+            form.data = form.data.copy()
+            form.data["version"] = current_version.isoformat()
+            return self.form_invalid(form)
+
 
 class TaskDeleteView(
     UserIsTaskAuthorMixin,
@@ -50,7 +228,11 @@ class TaskDeleteView(
 
 
 class TaskDetailView(
+    ReadReplicaMixin,
     DetailView,
 ):
     template_name = "tasks/detail.html"
     model = Task
+
+    def get_queryset(self):
+        return super().get_queryset().with_related()
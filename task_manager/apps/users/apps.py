@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+from task_manager.apps.core.model_versions import track_model_versions
 
 
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_manager.apps.users"
+
+    def ready(self):
+        # the auth backends module needs the app registry to be ready
+        from task_manager.apps.users.backends import invalidate_cached_user
+
+        user_model = self.get_model("User")
+        track_model_versions(user_model, unrendered_fields={"last_login"})
+        for signal in (post_save, post_delete):
+            signal.connect(invalidate_cached_user, sender=user_model)
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+CACHE_KEY = "auth_user:{}"
+CACHE_TIMEOUT = 300
+
+
+def cache_key(user_id) -> str:
+    return CACHE_KEY.format(user_id)
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend that keeps the request user in the default cache.
+
+    ``AuthenticationMiddleware`` loads the logged-in user on every request;
+    with this backend that is a cache hit instead of a query. Django still
+    checks the session auth hash against the cached user, and every save or
+    delete of the user (profile edit, password change, ``last_login`` on
+    login) drops the entry.
+
+    Only an entry in a cache shared by all workers (``CACHE_IS_SHARED``) can
+    be dropped everywhere; with a per-process cache the other workers would
+    keep accepting a changed password or a deleted user until the entry
+    expires, so the backend then reads the user from the database.
+    """
+
+    def get_user(self, user_id):
+        if not settings.CACHE_IS_SHARED:
+            return super().get_user(user_id)
+        key = cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, CACHE_TIMEOUT)
+        return user if self.user_can_authenticate(user) else None
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    cache.delete(cache_key(instance.pk))
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+from task_manager.apps.core.operations import AddPrefixSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_user_options'),
+    ]
+
+    operations = [
+        AddPrefixSearchIndex(
+            model_name='user',
+            field_name='username',
+            name='users_username_prefix_idx',
+        ),
+        AddPrefixSearchIndex(
+            model_name='user',
+            field_name='first_name',
+            name='users_first_name_prefix_idx',
+        ),
+        AddPrefixSearchIndex(
+            model_name='user',
+            field_name='last_name',
+            name='users_last_name_prefix_idx',
+        ),
+    ]
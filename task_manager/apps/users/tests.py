@@ -1,9 +1,18 @@
-from django.contrib.auth import get_user_model
+from django.contrib.auth import BACKEND_SESSION_KEY, get_user_model
 from django.contrib.auth.forms import UserCreationForm
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from task_manager.apps.core import text_constants
+from task_manager.apps.core.model_versions import get_version
+from task_manager.apps.core.query_budget import (
+    BUDGET_USERNAME,
+    QueryBudgetTestMixin,
+)
+from task_manager.apps.users.backends import cache_key
 
 
 class UnAuthenticatedUsersTest(TestCase):
@@ -130,6 +139,108 @@ class AuthenticatedUsersTest(TestCase):
         self.assertContains(response, text_constants.USER_PERMISSION_DENIED)
 
 
+@override_settings(CACHE_IS_SHARED=True)
+class CachedRequestUserTest(TestCase):
+    testuser_username = "user4"
+    testuser_password = "123"  # NOSONAR
+
+    statuses_index_url = reverse("statuses_index")
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.client.login(
+            username=self.testuser_username, password=self.testuser_password
+        )
+        self.addCleanup(cache.clear)
+
+    def user_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.statuses_index_url)
+        self.assertEqual(response.status_code, 200)
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if 'FROM "users_user"' in query["sql"]
+        ]
+
+    def test_steady_state_requests_skip_user_query(self):
+        self.user_queries()
+        self.assertEqual(self.user_queries(), [])
+
+    @override_settings(CACHE_IS_SHARED=False)
+    def test_per_process_cache_is_not_used(self):
+        # other workers could not see the eviction after a password change
+        self.user_queries()
+        self.assertEqual(len(self.user_queries()), 1)
+        self.assertIsNone(cache.get(cache_key(self.user.pk)))
+
+    def test_profile_edit_invalidates_cached_user(self):
+        self.user_queries()
+        self.assertIsNotNone(cache.get(cache_key(self.user.pk)))
+
+        response = self.client.post(
+            reverse("users_update", kwargs={"pk": self.user.pk}),
+            data={
+                "first_name": "Bob",
+                "last_name": "Tompson",
+                "username": "bob_18",
+                "password1": self.testuser_password,
+                "password2": self.testuser_password,
+            },
+        )
+        self.assertRedirects(
+            response, reverse("users_index"), fetch_redirect_response=False
+        )
+        self.assertIsNone(cache.get(cache_key(self.user.pk)))
+
+    def test_session_of_the_previous_backend_stays_logged_in(self):
+        self.client.logout()
+        self.client.force_login(
+            self.user, backend="django.contrib.auth.backends.ModelBackend"
+        )
+        response = self.client.get(self.statuses_index_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.wsgi_request.user, self.user)
+
+    def test_login_uses_the_cached_backend(self):
+        self.assertEqual(
+            self.client.session[BACKEND_SESSION_KEY],
+            "task_manager.apps.users.backends.CachedModelBackend",
+        )
+
+    def test_saved_user_is_reloaded(self):
+        self.user_queries()
+        self.user.first_name = "Renamed"
+        self.user.save()
+
+        self.assertEqual(len(self.user_queries()), 1)
+        response = self.client.get(self.statuses_index_url)
+        self.assertEqual(response.wsgi_request.user.first_name, "Renamed")
+
+
+class UserVersionStampTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="user4", password="123"
+        )
+        self.addCleanup(cache.clear)
+
+    def test_login_keeps_the_user_version(self):
+        version = get_version("users.user")
+        self.assertTrue(self.client.login(username="user4", password="123"))
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+        self.assertEqual(get_version("users.user"), version)
+
+    def test_profile_change_bumps_the_user_version(self):
+        version = get_version("users.user")
+        self.user.first_name = "Renamed"
+        self.user.save()
+        self.assertNotEqual(get_version("users.user"), version)
+
+
 class UnAuthenticatedUserssTest(TestCase):
     login_url = reverse("login")
     urls = [
@@ -143,3 +254,14 @@ class UnAuthenticatedUserssTest(TestCase):
                 response = self.client.get(url, follow=True)
                 self.assertRedirects(response, f"{login_url}?next={url}")
                 self.assertContains(response, text_constants.LOGIN_REQUIRED)
+
+
+class UsersQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    query_budgets = {
+        "users_index": 3,
+        "users_create": 2,
+        "users_update": 5,
+        "users_delete": 5,
+    }
+
+    budget_object = get_user_model().objects.filter(username=BUDGET_USERNAME)
@@ -1,24 +1,35 @@
 from django.contrib.auth.decorators import login_not_required
 from django.contrib.messages.views import SuccessMessageMixin
+from django.db.models.functions import Coalesce
 from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager.apps.core import text_constants
 from task_manager.apps.core.mixins import (
+    KeysetPaginationMixin,
+    ReadReplicaMixin,
     RestrictUserDeleteMixin,
     UserIsProfileOwnerMixin,
 )
+from task_manager.apps.core.views import AutocompleteView
 from task_manager.apps.users.forms import UserCreateForm, UserUpdateForm
 from task_manager.apps.users.models import User
 
 
 @method_decorator(login_not_required, name="dispatch")
-class UserIndexView(ListView):
+class UserIndexView(ReadReplicaMixin, KeysetPaginationMixin, ListView):
     model = User
     template_name = "users/index.html"
     context_object_name = "users"
 
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .annotate(task_count=Coalesce("executor_task_counter__count", 0))
+        )
+
 
 @method_decorator(login_not_required, name="dispatch")
 class UserCreateView(SuccessMessageMixin, CreateView):
@@ -51,3 +62,8 @@ class UserDeleteView(
     success_message = text_constants.USER_DELETED
     template_name = "users/delete.html"
     success_url = reverse_lazy("users_index")
+
+
+class UserSearchView(AutocompleteView):
+    model = User
+    search_fields = ["username", "first_name", "last_name"]
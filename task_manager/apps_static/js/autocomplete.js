@@ -0,0 +1,64 @@
+// Fills <select data-autocomplete-url> options from a JSON search endpoint.
+// The server only renders the selected options; typing in the search box
+// above the select replaces the other options with the matching page.
+(function () {
+  "use strict";
+
+  var DEBOUNCE_MS = 250;
+
+  function setup(select) {
+    var search = document.createElement("input");
+    search.type = "search";
+    search.className = "form-control mb-1";
+    search.placeholder = select.dataset.autocompletePlaceholder || "";
+    select.parentNode.insertBefore(search, select);
+
+    var timer = null;
+    var request = 0;
+
+    function load() {
+      var current = ++request;
+      var url = select.dataset.autocompleteUrl +
+        "?q=" + encodeURIComponent(search.value.trim());
+      fetch(url, { credentials: "same-origin" })
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+          if (current === request) {
+            render(data.results);
+          }
+        });
+    }
+
+    function render(results) {
+      Array.prototype.slice.call(select.options).forEach(function (option) {
+        if (option.value !== "" && !option.selected) {
+          option.remove();
+        }
+      });
+      var present = {};
+      Array.prototype.forEach.call(select.options, function (option) {
+        present[option.value] = true;
+      });
+      results.forEach(function (item) {
+        var value = String(item.id);
+        if (!present[value]) {
+          select.add(new Option(item.text, value));
+        }
+      });
+    }
+
+    search.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(load, DEBOUNCE_MS);
+    });
+    search.addEventListener("focus", function () {
+      if (select.options.length <= 2) {
+        load();
+      }
+    }, { once: true });
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll("select[data-autocomplete-url]").forEach(setup);
+  });
+})();
@@ -8,6 +8,30 @@ import dj_database_url
 from dotenv import load_dotenv
 
 
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = (os.getenv(name) or "").strip().lower()
+    if not value:
+        return default
+    return value not in {"0", "false", "no", "off"}
+
+
+def check_pooled_connection(conn) -> None:
+    """Run an empty statement on a connection taken from the pool.
+
+    Same check as ``psycopg_pool.ConnectionPool.check_connection``, kept here
+    so the settings module does not import the pool package. A connection
+    that died with a database failover raises and the pool replaces it.
+    """
+    if conn.autocommit:
+        conn.execute("")
+        return
+    conn.autocommit = True
+    try:
+        conn.execute("")
+    finally:
+        conn.autocommit = False
+
+
 class Config:
     def __init__(self) -> None:
         load_dotenv()
@@ -31,31 +55,187 @@ class Config:
         self.rollbar_token: str = os.getenv(
             "ROLLBAR_ACCESS_TOKEN"
         ) or os.getenv("ROLLBAR_TOKEN", "")
+        self.rollbar_endpoint: str = (
+            os.getenv("ROLLBAR_ENDPOINT") or "https://api.rollbar.com/api/1/"
+        )
+
+        self.cache_templates: bool = self.is_production
+
+        self.slow_request_ms: int = int(os.getenv("SLOW_REQUEST_MS") or 500)
+        self.request_log_level: str = (
+            os.getenv("REQUEST_LOG_LEVEL")
+            or ("INFO" if self.is_production else "WARNING")
+        ).upper()
+
+        self.db_conn_max_age: int = int(os.getenv("DB_CONN_MAX_AGE") or 600)
+        self.db_health_checks: bool = _env_flag("DB_CONN_HEALTH_CHECKS", True)
+        self.db_pool: bool = _env_flag("DB_POOL")
+        self.db_pool_min_size: int = int(os.getenv("DB_POOL_MIN_SIZE") or 2)
+        self.db_pool_max_size: int = int(os.getenv("DB_POOL_MAX_SIZE") or 10)
+        self.db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT") or 10)
+
+        self.session_backend: str = (
+            os.getenv("SESSION_BACKEND") or "db"
+        ).lower()
+
+        self.sqlite_tuned: bool = _env_flag("SQLITE_TUNED")
+        self.sqlite_busy_timeout: float = float(
+            os.getenv("SQLITE_BUSY_TIMEOUT") or 20
+        )
+
+        replicas_env = os.getenv("DATABASE_REPLICA_URLS", "")
+        self.replica_urls: list[str] = [
+            x.strip() for x in replicas_env.split(",") if x.strip()
+        ]
+        self.replica_pin_seconds: int = int(
+            os.getenv("REPLICA_PIN_SECONDS") or 10
+        )
 
     def setup_database(self, base_dir: Path) -> dict:
         db_url = os.getenv("DATABASE_URL")
         if db_url:
-            cfg = dj_database_url.parse(
-                db_url,
-                conn_max_age=600,
-                ssl_require=self.is_production,
-            )
-
-            engine = cfg.get("ENGINE", "")
-            is_postgres = "postgresql" in engine or "postgres" in engine
-            if is_postgres and not self.is_production:
-                opts = cfg.setdefault("OPTIONS", {})
-                opts["sslmode"] = "disable"
-
-            return cfg
+            return self._parse_database_url(db_url)
 
         logging.warning(
             "No DATABASE_URL environment variable set, falling back to sqlite."
         )
-        return {
+        cfg = {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": str(base_dir / "db.sqlite3"),
         }
+        if self.sqlite_tuned:
+            cfg["OPTIONS"] = self.sqlite_options
+        return cfg
+
+    def setup_replicas(self) -> dict:
+        replicas = {}
+        for number, url in enumerate(self.replica_urls, start=1):
+            cfg = self._parse_database_url(url)
+            # tests run against the primary's test database only
+            cfg["TEST"] = {"MIRROR": "default"}
+            replicas[f"replica_{number}"] = cfg
+        return replicas
+
+    def _parse_database_url(self, db_url: str) -> dict:
+        cfg = dj_database_url.parse(
+            db_url,
+            conn_max_age=self.db_conn_max_age,
+            conn_health_checks=self.db_health_checks,
+            ssl_require=self.is_production,
+        )
+
+        engine = cfg.get("ENGINE", "")
+        is_postgres = "postgresql" in engine or "postgres" in engine
+        if is_postgres and not self.is_production:
+            opts = cfg.setdefault("OPTIONS", {})
+            opts["sslmode"] = "disable"
+        if is_postgres and self.db_pool:
+            # Django refuses persistent connections next to a pool: the
+            # pool keeps them open and hands one out per request.
+            cfg["CONN_MAX_AGE"] = 0
+            opts = cfg.setdefault("OPTIONS", {})
+            opts["pool"] = self.pool_options
+
+        return cfg
+
+    @property
+    def sqlite_options(self) -> dict:
+        return {
+            # WAL lets readers run alongside the single writer, and NORMAL
+            # only syncs at checkpoints, which is safe in WAL mode
+            "init_command": (
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA mmap_size=134217728;"
+                "PRAGMA cache_size=-20000;"
+                "PRAGMA temp_store=MEMORY;"
+            ),
+            "timeout": self.sqlite_busy_timeout,
+            # take the write lock when the transaction starts: a deferred
+            # transaction that upgrades to a writer fails with "database is
+            # locked" at once instead of waiting for the busy timeout
+            "transaction_mode": "IMMEDIATE",
+        }
+
+    @property
+    def pool_options(self) -> dict:
+        pool = {
+            "min_size": self.db_pool_min_size,
+            "max_size": self.db_pool_max_size,
+            "timeout": self.db_pool_timeout,
+        }
+        if self.db_health_checks:
+            pool["check"] = check_pooled_connection
+        return pool
+
+    @property
+    def cache_is_shared(self) -> bool:
+        """Whether every worker process reads and evicts the same cache."""
+        scheme = os.getenv("CACHE_URL", "").partition("://")[0]
+        return scheme in {"redis", "rediss", "file"}
+
+    def setup_cache(self) -> dict:
+        cache_url = os.getenv("CACHE_URL", "")
+        scheme, _, location = cache_url.partition("://")
+        if scheme in {"redis", "rediss"}:
+            return {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": cache_url,
+            }
+        if scheme == "file":
+            return {
+                "BACKEND": "django.core.cache.backends.filebased."
+                "FileBasedCache",
+                "LOCATION": location,
+            }
+
+        if self.is_production:
+            logging.warning(
+                "No CACHE_URL environment variable set, falling back to "
+                "a per-process local memory cache."
+            )
+        return {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+
+    SESSION_ENGINES = {
+        "db": "django.contrib.sessions.backends.db",
+        # the cache comes from CACHE_URL and must be shared by the workers,
+        # or a logout only evicts the session in the one that served it
+        "cached_db": "django.contrib.sessions.backends.cached_db",
+        # no server-side storage at all, the session lives in the cookie
+        "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+    }
+
+    @property
+    def session_engine(self) -> str:
+        engine = self.SESSION_ENGINES.get(self.session_backend)
+        if engine is None:
+            logging.warning(
+                "Unknown SESSION_BACKEND %r, using the database.",
+                self.session_backend,
+            )
+            return self.SESSION_ENGINES["db"]
+        if self.session_backend == "cached_db" and not self.cache_is_shared:
+            logging.warning(
+                "SESSION_BACKEND=cached_db needs a shared CACHE_URL, using "
+                "the database."
+            )
+            return self.SESSION_ENGINES["db"]
+        return engine
+
+    @property
+    def template_loaders(self) -> list | None:
+        """Return the pinned cached loaders, or None for Django's default."""
+        if not self.cache_templates:
+            return None
+        return [
+            (
+                "django.template.loaders.cached.Loader",
+                [
+                    "django.template.loaders.filesystem.Loader",
+                    "django.template.loaders.app_directories.Loader",
+                ],
+            )
+        ]
 
     @property
     def allowed_hosts(self) -> list[str]:
@@ -38,12 +38,14 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "task_manager.apps.core.middleware.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "task_manager.apps.core.middleware.ReplicaRoutingMiddleware",
     "task_manager.apps.core.middleware.LoginRequiredWithMessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "task_manager.apps.core.middleware.RollbarNotifierMiddleware",
@@ -56,7 +58,7 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "task_manager" / "templates"],
-        "APP_DIRS": True,
+        "APP_DIRS": config.template_loaders is None,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.request",
@@ -67,9 +69,25 @@ TEMPLATES = [
     },
 ]
 
+if config.template_loaders is not None:
+    TEMPLATES[0]["OPTIONS"]["loaders"] = config.template_loaders
+
+WARM_TEMPLATES = config.cache_templates
+
 WSGI_APPLICATION = "task_manager.wsgi.application"
 
-DATABASES = {"default": config.setup_database(BASE_DIR)}
+DATABASES = {
+    "default": config.setup_database(BASE_DIR),
+    **config.setup_replicas(),
+}
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["task_manager.apps.core.db_router.ReplicaRouter"]
+REPLICA_PIN_SECONDS = config.replica_pin_seconds
+
+CACHES = {"default": config.setup_cache()}
+CACHE_IS_SHARED = config.cache_is_shared
+
+SESSION_ENGINE = config.session_engine
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -79,6 +97,12 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 AUTH_USER_MODEL = "users.User"
+AUTHENTICATION_BACKENDS = [
+    "task_manager.apps.users.backends.CachedModelBackend",
+    # sessions store the backend that logged them in; keep the old one so
+    # sessions from before the cached backend stay valid
+    "django.contrib.auth.backends.ModelBackend",
+]
 LOGIN_URL = reverse_lazy("login")
 
 
@@ -103,7 +127,25 @@ if not DEBUG:
 
 ROLLBAR = {
     "access_token": config.rollbar_token,
+    "endpoint": config.rollbar_endpoint,
     "environment": "development" if DEBUG else "production",
     "code_version": "1.0",
     "root": BASE_DIR,
 }
+
+SLOW_REQUEST_MS = config.slow_request_ms
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "task_manager.requests": {
+            "handlers": ["console"],
+            "level": config.request_log_level,
+            "propagate": False,
+        },
+    },
+}